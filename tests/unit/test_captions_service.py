@@ -1,5 +1,6 @@
 from pathlib import Path
 import tempfile
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from yt_downloader.captions import CaptionsService
 from yt_downloader.models import VideoItem, CaptionTrack
@@ -38,6 +39,17 @@ def make_video():
     return VideoItem(index=1, video_id="vid", title="T", preferred_quality="720p")
 
 
+def make_session(body: bytes):
+    """Stand-in for the pooled requests.Session serving one subtitle body."""
+    response = MagicMock()
+    response.content = body
+    response.iter_content.return_value = [body]
+    response.__enter__.return_value = response
+    session = MagicMock()
+    session.get.return_value = response
+    return session
+
+
 def test_obtain_manual_preferred():
     svc = DummyCap(manual=True, auto=True)
     v = make_video()
@@ -62,15 +74,15 @@ def test_obtain_none():
 def test_fetch_manual_real_implementation():
     """Test that the real fetch_manual implementation properly handles subtitle extraction."""
     with tempfile.TemporaryDirectory() as temp_dir:
-        service = CaptionsService(Path(temp_dir), ["en"])
-        video = make_video()
-
-        # Mock yt-dlp and urllib to simulate successful subtitle extraction
+        # Mock yt-dlp and the HTTP session to simulate successful subtitle extraction
         mock_subtitle_data = "1\n00:00:01,000 --> 00:00:03,000\nHello world\n\n"
+        session = make_session(mock_subtitle_data.encode("utf-8"))
+        service = CaptionsService(Path(temp_dir), ["en"], session=session)
+        video = make_video()
 
         with patch("yt_dlp.YoutubeDL") as mock_ydl_class:
             mock_ydl = MagicMock()
-            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            mock_ydl_class.return_value = mock_ydl
 
             # Mock extract_info to return subtitle information
             mock_ydl.extract_info.return_value = {
@@ -79,35 +91,27 @@ def test_fetch_manual_real_implementation():
                 }
             }
 
-            # Mock urllib.request.urlopen
-            with patch("urllib.request.urlopen") as mock_urlopen:
-                mock_response = MagicMock()
-                mock_response.read.return_value = mock_subtitle_data.encode("utf-8")
-                mock_urlopen.return_value.__enter__.return_value = mock_response
-
-                # Test the method
-                track = service.fetch_manual(video)
+            # Test the method
+            track = service.fetch_manual(video)
 
-                # Verify the result
-                assert track is not None
-                assert track.video_id == "vid"
-                assert track.language == "en"
-                assert track.kind == "manual"
-                assert track.format == "srt"
+            # Verify the result
+            assert track is not None
+            assert track.video_id == "vid"
+            assert track.language == "en"
+            assert track.kind == "manual"
+            assert track.format == "srt"
+            session.get.assert_called_once()
 
-                # Verify the caption file was created
-                caption_path = Path(track.path)
-                assert caption_path.exists()
-                content = caption_path.read_text()
-                assert "Hello world" in content
+            # Verify the caption file was created
+            caption_path = Path(track.path)
+            assert caption_path.exists()
+            content = caption_path.read_text()
+            assert "Hello world" in content
 
 
 def test_fetch_manual_vtt_conversion():
     """Test that VTT subtitles are properly converted to SRT format."""
     with tempfile.TemporaryDirectory() as temp_dir:
-        service = CaptionsService(Path(temp_dir), ["en"])
-        video = make_video()
-
         # Mock VTT content that needs conversion
         mock_vtt_data = """WEBVTT
 
@@ -117,10 +121,14 @@ Hello world
 00:00:04.000 --> 00:00:06.000
 Second subtitle
 """
+        service = CaptionsService(
+            Path(temp_dir), ["en"], session=make_session(mock_vtt_data.encode("utf-8"))
+        )
+        video = make_video()
 
         with patch("yt_dlp.YoutubeDL") as mock_ydl_class:
             mock_ydl = MagicMock()
-            mock_ydl_class.return_value.__enter__.return_value = mock_ydl
+            mock_ydl_class.return_value = mock_ydl
 
             # Mock extract_info to return VTT subtitle information
             mock_ydl.extract_info.return_value = {
@@ -129,24 +137,222 @@ Second subtitle
                 }
             }
 
-            # Mock urllib.request.urlopen
-            with patch("urllib.request.urlopen") as mock_urlopen:
-                mock_response = MagicMock()
-                mock_response.read.return_value = mock_vtt_data.encode("utf-8")
-                mock_urlopen.return_value.__enter__.return_value = mock_response
-
-                # Test the method
-                track = service.fetch_manual(video)
-
-                # Verify the result
-                assert track is not None
-                assert track.format == "srt"
-
-                # Verify the caption file was created and VTT was converted to SRT
-                caption_path = Path(track.path)
-                assert caption_path.exists()
-                content = caption_path.read_text()
-                # Should have SRT timestamps (with commas, not dots)
-                assert "00:00:01,000 --> 00:00:03,000" in content
-                assert "Hello world" in content
-                assert "Second subtitle" in content
+            # Test the method
+            track = service.fetch_manual(video)
+
+            # Verify the result
+            assert track is not None
+            assert track.format == "srt"
+
+            # Verify the caption file was created and VTT was converted to SRT
+            caption_path = Path(track.path)
+            assert caption_path.exists()
+            content = caption_path.read_text()
+            # Should have SRT timestamps (with commas, not dots)
+            assert "00:00:01,000 --> 00:00:03,000" in content
+            assert "Hello world" in content
+            assert "Second subtitle" in content
+
+
+def test_format_ts():
+    svc = CaptionsService(Path("."))
+    assert svc._format_ts(0) == "00:00:00,000"
+    assert svc._format_ts(1.001) == "00:00:01,001"
+    assert svc._format_ts(3725.5) == "01:02:05,500"
+    assert svc._format_ts(3599.999) == "00:59:59,999"
+    assert svc._format_ts(3600) == "01:00:00,000"
+
+
+def test_fetch_first_keeps_language_priority():
+    class Probe(CaptionsService):
+        def _fetch_subtitle_entry(self, video, lang, entries, kind="manual"):
+            return None if lang == "en" else f"{lang} srt".encode()
+
+    svc = Probe(Path("."), ["en", "es", "fr"])
+    subs = {lang: [] for lang in ("en", "es", "fr")}
+    assert svc._fetch_first(make_video(), ["en", "es", "fr"], subs) == ("es", b"es srt")
+    assert svc._fetch_first(make_video(), [], subs) is None
+
+
+def test_write_transcript_srt_layout():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "t.srt"
+        CaptionsService(Path(temp_dir))._write_transcript(
+            path,
+            [
+                SimpleNamespace(start=1.0, duration=2.0, text="a\nb"),
+                SimpleNamespace(start=4.0, duration=1.0, text=""),
+            ],
+        )
+        assert path.read_text(encoding="utf-8") == (
+            "1\n00:00:01,000 --> 00:00:03,000\na b\n\n"
+            "2\n00:00:04,000 --> 00:00:05,000\n[NO TEXT]\n"
+        )
+
+
+def test_get_info_is_cached_per_video():
+    with patch("yt_dlp.YoutubeDL") as mock_ydl_class:
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"id": "vid", "subtitles": {}}
+        svc = CaptionsService(Path("."))
+        assert svc._get_info("vid") is svc._get_info("vid")
+        assert mock_ydl.extract_info.call_count == 1
+
+
+def test_fetch_auto_transcript_api_single_listing():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        svc = CaptionsService(Path(temp_dir), ["de", "en"])
+        found = MagicMock(language_code="en")
+        found.fetch.return_value = [SimpleNamespace(start=0.0, duration=1.5, text="hi")]
+        api = MagicMock()
+        api.return_value.list.return_value.find_transcript.return_value = found
+        with patch.object(svc, "_get_info", return_value={}), patch(
+            "yt_downloader.captions.YouTubeTranscriptApi", api
+        ):
+            track = svc.fetch_auto(make_video())
+        assert track is not None and track.kind == "auto" and track.language == "en"
+        api.return_value.list.assert_called_once_with("vid")
+        api.return_value.list.return_value.find_transcript.assert_called_once_with(("de", "en"))
+        assert "00:00:00,000 --> 00:00:01,500\nhi" in Path(track.path).read_text(encoding="utf-8")
+
+
+def test_obtain_shares_then_evicts_metadata():
+    with tempfile.TemporaryDirectory() as temp_dir, patch("yt_dlp.YoutubeDL") as mock_ydl_class:
+        mock_ydl = MagicMock()
+        mock_ydl_class.return_value = mock_ydl
+        mock_ydl.extract_info.return_value = {"id": "vid", "subtitles": {}, "automatic_captions": {}}
+        with patch("yt_downloader.captions.YouTubeTranscriptApi", None):
+            svc = CaptionsService(Path(temp_dir), ["en"])
+            assert svc.obtain(make_video(), want_manual=True, want_auto=True) == []
+        # Manual miss fell back to auto using the same extraction
+        assert mock_ydl.extract_info.call_count == 1
+        assert svc._info_cache == {}
+
+
+def test_fetch_any_returns_first_success():
+    class Probe(CaptionsService):
+        def _fetch_subtitle_entry(self, video, lang, entries, kind="manual"):
+            return b"de srt" if lang == "de" else None
+
+    svc = Probe(Path("."), ["en"])
+    assert svc._fetch_any(make_video(), {"fr": [], "de": [], "it": []}) == ("de", b"de srt")
+    assert svc._fetch_any(make_video(), {}) is None
+
+
+def test_fetch_any_keeps_advertised_order_and_skips_errors():
+    import time
+
+    class Probe(CaptionsService):
+        def _fetch_subtitle_entry(self, video, lang, entries, kind="manual"):
+            if lang == "fr":
+                raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "bad vtt")
+            if lang == "de":
+                time.sleep(0.05)  # finishes after "it"
+            return f"{lang} srt".encode()
+
+    svc = Probe(Path("."), ["en"])
+    subs = {"fr": [], "de": [], "it": []}
+    assert svc._fetch_any(make_video(), subs) == ("de", b"de srt")
+
+
+def test_fetch_manual_reuses_caption_on_disk():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        existing = Path(temp_dir) / "T.en.manual.srt"
+        existing.write_text("1\n00:00:00,000 --> 00:00:01,000\nhi\n", encoding="utf-8")
+        svc = CaptionsService(Path(temp_dir), ["en"])
+        with patch.object(svc, "_get_info") as get_info:
+            track = svc.fetch_manual(make_video())
+        get_info.assert_not_called()
+        assert track is not None and Path(track.path) == existing
+
+        forced = CaptionsService(Path(temp_dir), ["en"], force_refresh=True)
+        with patch.object(forced, "_get_info", return_value=None) as get_info:
+            assert forced.fetch_manual(make_video()) is None
+        get_info.assert_called_once()
+
+
+def test_prime_info_skips_extraction():
+    with patch("yt_dlp.YoutubeDL") as mock_ydl_class:
+        svc = CaptionsService(Path("."))
+        info = {"id": "vid", "subtitles": {}}
+        svc.prime_info("vid", info)
+        assert svc._get_info("vid") is info
+        mock_ydl_class.return_value.extract_info.assert_not_called()
+
+
+def test_fetch_first_stops_at_first_hit():
+    calls = []
+
+    class Probe(CaptionsService):
+        def _fetch_subtitle_entry(self, video, lang, entries, kind="manual"):
+            calls.append(lang)
+            return f"{lang} srt".encode()
+
+    svc = Probe(Path("."), ["en", "es", "fr"])
+    subs = {lang: [] for lang in ("en", "es", "fr")}
+    assert svc._fetch_first(make_video(), ["en", "es", "fr"], subs) == ("en", b"en srt")
+    assert calls == ["en"]
+
+
+def test_obtain_many_preserves_order_and_reuses_pool():
+    svc = DummyCap(manual=True, auto=False)
+    videos = [
+        VideoItem(index=i, video_id=f"v{i}", title="T", preferred_quality="720p")
+        for i in range(5)
+    ]
+    results = svc.obtain_many(videos, want_manual=True, want_auto=False)
+    assert [tracks[0].video_id for tracks in results] == [v.video_id for v in videos]
+    pool = svc._executor
+    svc.obtain_many(videos[:2], want_manual=True, want_auto=False)
+    assert svc._executor is pool
+    assert svc.obtain_many([], want_manual=True, want_auto=False) == []
+    svc.close()
+    assert svc._executor is None
+
+
+def test_aobtain_many_preserves_order():
+    import asyncio
+
+    svc = DummyCap(manual=False, auto=True)
+    videos = [
+        VideoItem(index=i, video_id=f"v{i}", title="T", preferred_quality="720p")
+        for i in range(5)
+    ]
+    results = asyncio.run(svc.aobtain_many(videos, want_manual=False, want_auto=True))
+    assert [tracks[0].video_id for tracks in results] == [v.video_id for v in videos]
+    assert asyncio.run(svc.aobtain_many([], want_manual=False, want_auto=True)) == []
+    svc.close()
+
+
+def test_aobtain_many_respects_limit():
+    import asyncio
+    import threading
+    import time
+
+    svc = DummyCap(manual=True, auto=False)
+    active = peak = 0
+    lock = threading.Lock()
+    fetch = svc.fetch_manual
+
+    def slow_fetch(video):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return fetch(video)
+
+    svc.fetch_manual = slow_fetch
+    videos = [
+        VideoItem(index=i, video_id=f"v{i}", title="T", preferred_quality="720p")
+        for i in range(6)
+    ]
+    results = asyncio.run(
+        svc.aobtain_many(videos, want_manual=True, want_auto=False, limit=2)
+    )
+    assert [tracks[0].video_id for tracks in results] == [v.video_id for v in videos]
+    assert peak <= 2
+    svc.close()
@@ -0,0 +1,43 @@
+import os
+
+from yt_downloader.config import AppConfig
+
+
+def test_from_file_reloads_after_change(tmp_path):
+    path = tmp_path / "config.json"
+    AppConfig(caption_langs=["de"]).save(path)
+    first = AppConfig.from_file(path)
+    first.caption_langs.append("fr")
+    assert AppConfig.from_file(path).caption_langs == ["de"]
+
+    AppConfig(caption_langs=["es", "en"]).save(path)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert AppConfig.from_file(path).caption_langs == ["es", "en"]
+
+
+def test_from_file_missing_returns_defaults(tmp_path):
+    assert AppConfig.from_file(tmp_path / "absent.json") == AppConfig()
+
+
+def test_save_creates_missing_parent(tmp_path):
+    path = tmp_path / "nested" / "dir" / "config.json"
+    AppConfig(layout_ratio=40).save(path)
+    assert AppConfig.from_file(path).layout_ratio == 40
+
+
+def test_quality_order_for_known_and_custom():
+    assert AppConfig.quality_order_for("480p") == [
+        "480p", "1080p", "720p", "360p", "240p", "144p"
+    ]
+    assert AppConfig.quality_order_for("1440p")[:2] == ["1440p", "1080p"]
+
+
+def test_to_dict_detaches_list_fields():
+    cfg = AppConfig()
+    snap = cfg.to_dict()
+    cfg.quality_order.insert(0, "2160p")
+    cfg.caption_langs.append("de")
+    assert snap["quality_order"][0] == "1080p"
+    assert snap["caption_langs"] == ["en"]
+    assert isinstance(snap["output_dir"], str)
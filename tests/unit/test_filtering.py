@@ -17,7 +17,7 @@ def test_parse_index_range_valid(spec, start, end):
     assert rng == (start, end)
 
 
-@pytest.mark.parametrize("spec", ["bad", "::", "a:1", "1:b"])
+@pytest.mark.parametrize("spec", ["bad", "::", "a:1", "1:b", "-1:3", "1:2\n"])
 def test_parse_index_range_invalid(spec):
     with pytest.raises(ValueError):
         parse_index_range(spec)
@@ -0,0 +1,119 @@
+from yt_downloader.downloader import PlaylistDownloader
+
+
+def test_selected_height_prefers_downloaded_format():
+    result = {"requested_downloads": [{"height": 480, "filepath": "x.mp4"}]}
+    formats = [{"height": 1080, "vcodec": "avc1"}, {"height": 480, "vcodec": "avc1"}]
+    assert PlaylistDownloader._selected_height(result, formats) == 480
+
+
+def test_selected_height_falls_back_to_tallest_video_format():
+    formats = [
+        {"height": 2160, "vcodec": "none"},  # storyboard
+        {"height": 720, "vcodec": "avc1"},
+        {"vcodec": "none", "acodec": "mp4a"},
+    ]
+    assert PlaylistDownloader._selected_height({}, formats) == 720
+    assert PlaylistDownloader._selected_height(None, []) == 0
+
+
+def test_progress_hook_keys_state_by_token():
+    import threading
+    from unittest.mock import MagicMock
+
+    from yt_downloader.config import AppConfig
+    from yt_downloader.downloader import PROGRESS_TOKEN_KEY
+
+    seen = []
+    d = PlaylistDownloader(AppConfig(), progress_callback=seen.append)
+    d.__dict__["progress"] = MagicMock()  # skip building the Rich bar
+    d._progress_state[7] = ["task", 0]
+    hook = {
+        "status": "downloading",
+        "downloaded_bytes": 2 << 20,
+        "total_bytes": 4 << 20,
+        "info_dict": {"id": "vid", PROGRESS_TOKEN_KEY: 7},
+    }
+    # Fragment threads have none of the worker's thread-local state
+    t = threading.Thread(target=d._yt_dlp_progress_hook, args=(hook,))
+    t.start()
+    t.join()
+    d.progress.update.assert_called_once_with("task", completed=2 << 20, total=4 << 20)
+    assert seen == [50.0]
+    assert d._progress_state[7][1] == 2 << 20
+
+
+def test_duplicate_video_gets_separate_progress_slots(tmp_path):
+    from unittest.mock import MagicMock, patch
+
+    from yt_downloader.config import AppConfig
+    from yt_downloader.downloader import PROGRESS_TOKEN_KEY
+
+    d = PlaylistDownloader(AppConfig(retry_attempts=1))
+    d.__dict__["progress"] = MagicMock()
+    tokens = []
+
+    def download(info, download):
+        tokens.append(info[PROGRESS_TOKEN_KEY])
+        assert info[PROGRESS_TOKEN_KEY] in d._progress_state
+        return {}
+
+    ydl = MagicMock()
+    ydl.extract_info.side_effect = lambda *a, **k: {
+        "id": "vid", "title": "T", "formats": [{"height": 720, "vcodec": "avc1"}]
+    }
+    ydl.process_ie_result.side_effect = download
+    with patch.object(d, "_ydl_for", return_value=ydl):
+        for _ in range(2):
+            d._process_video("https://youtu.be/vid", tmp_path, True)
+    assert len(set(tokens)) == 2
+    assert d._progress_state == {}
+
+
+def test_stale_cached_info_gets_fresh_retry(tmp_path):
+    from unittest.mock import MagicMock, patch
+
+    from yt_dlp.utils import DownloadError
+
+    from yt_downloader.config import AppConfig
+
+    d = PlaylistDownloader(AppConfig(retry_attempts=1))
+    d.__dict__["progress"] = MagicMock()
+    fresh = {"id": "vid", "title": "T", "formats": [{"height": 720, "vcodec": "avc1"}]}
+    cache = MagicMock()
+    cache.get.side_effect = [dict(fresh), None]
+    ydl = MagicMock()
+    ydl.extract_info.return_value = fresh
+    ydl.process_ie_result.side_effect = [DownloadError("HTTP Error 403"), {}]
+    with patch.object(d, "_metadata_cache_for", return_value=cache), patch.object(
+        d, "_ydl_for", return_value=ydl
+    ):
+        vr = d._process_video("https://youtu.be/vid", tmp_path, True, video_id="vid")
+    assert vr.status == "success"
+    cache.invalidate.assert_called_once_with("vid")
+    ydl.extract_info.assert_called_once()
+
+
+def test_metadata_cache_errors_do_not_fail_download(tmp_path):
+    import sqlite3
+    from unittest.mock import MagicMock, patch
+
+    from yt_downloader.config import AppConfig
+
+    d = PlaylistDownloader(AppConfig(retry_attempts=1))
+    d.__dict__["progress"] = MagicMock()
+    cache = MagicMock()
+    cache.get.side_effect = sqlite3.OperationalError("database is locked")
+    cache.put.side_effect = TypeError("not serializable")
+    ydl = MagicMock()
+    ydl.extract_info.return_value = {
+        "id": "vid", "title": "T", "formats": [{"height": 720, "vcodec": "avc1"}]
+    }
+    ydl.process_ie_result.return_value = {}
+    with patch.object(d, "_metadata_cache_for", return_value=cache), patch.object(
+        d, "_ydl_for", return_value=ydl
+    ):
+        vr = d._process_video("https://youtu.be/vid", tmp_path, True, video_id="vid")
+    assert vr.status == "success"
+    cache.put.assert_called_once()
+    ydl.extract_info.assert_called_once()
@@ -0,0 +1,23 @@
+from pathlib import Path
+from yt_downloader import jsonio
+
+
+def test_dumps_roundtrip_indented():
+    data = {"videos": {"abc": {"status": "success", "title": "Café"}}}
+    out = jsonio.dumps(data)
+    assert isinstance(out, bytes)
+    assert b"\n  " in out  # two-space indentation
+    assert jsonio.loads(out) == data
+
+
+def test_dumps_default_hook():
+    out = jsonio.dumps({"path": Path("/tmp/x")}, indent=False, default=str)
+    assert jsonio.loads(out) == {"path": "/tmp/x"}
+
+
+def test_write_atomic_replaces_without_leftovers(tmp_path):
+    target = tmp_path / "manifest.json"
+    target.write_bytes(b"old")
+    jsonio.write_atomic(target, b'{"a": 1}')
+    assert target.read_bytes() == b'{"a": 1}'
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
@@ -46,3 +46,42 @@ def test_manifest_compute_skips_missing_file(tmp_path: Path):
     m.save()
     skips = m.compute_skips(tmp_path)
     assert "abc" not in skips
+
+
+def test_manifest_cached_entries_roundtrip(tmp_path: Path):
+    m = Manifest.load(tmp_path)
+    m.set_playlist("pl")
+    m.set_entries([{"index": 1, "id": "abc", "url": None, "title": "T"}])
+    m.save()
+    loaded = Manifest.load(tmp_path)
+    assert loaded.cached_entries("pl") == [
+        {"index": 1, "id": "abc", "url": None, "title": "T"}
+    ]
+    assert loaded.cached_entries("other") is None
+
+
+def test_manifest_save_skips_unchanged(tmp_path: Path):
+    m = Manifest.load(tmp_path)
+    m.set_playlist("pl")
+    m.update_video(make_video("abc"))
+    m.save()
+    path = tmp_path / "manifest.json"
+    path.write_text("sentinel")
+    m.set_playlist("pl")
+    m.update_video(make_video("abc"))
+    m.save()
+    assert path.read_text() == "sentinel"
+    m.update_video(make_video("abc", status="failed"))
+    m.save()
+    assert json.loads(path.read_text())["videos"]["abc"]["status"] == "failed"
+
+
+def test_manifest_cached_entries_expire(tmp_path: Path):
+    m = Manifest.load(tmp_path)
+    m.set_playlist("pl")
+    m.set_entries([{"index": 1, "id": "abc", "url": None, "title": "T"}])
+    assert m.cached_entries("pl") is not None
+    assert m.cached_entries("pl", max_age=-1) is None
+    # Listings recorded before timestamps were kept are never trusted
+    del m.data["entries_fetched"]
+    assert m.cached_entries("pl") is None
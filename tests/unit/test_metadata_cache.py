@@ -0,0 +1,34 @@
+from unittest.mock import patch
+
+from yt_downloader.metadata_cache import MetadataCache
+
+
+def test_put_get_roundtrip_and_invalidate(tmp_path):
+    cache = MetadataCache.open(tmp_path)
+    info = {"id": "vid", "title": "Café", "formats": [{"format_id": "18", "height": 360}]}
+    cache.put("vid", info)
+    assert cache.get("vid") == info
+    assert cache.get("other") is None
+    cache.invalidate("vid")
+    assert cache.get("vid") is None
+    cache.close()
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    cache = MetadataCache.open(tmp_path, ttl=60)
+    with patch("yt_downloader.metadata_cache.time.time", return_value=1000.0):
+        cache.put("vid", {"id": "vid"})
+    with patch("yt_downloader.metadata_cache.time.time", return_value=1030.0):
+        assert cache.get("vid") == {"id": "vid"}
+    with patch("yt_downloader.metadata_cache.time.time", return_value=1061.0):
+        assert cache.get("vid") is None
+    cache.close()
+
+
+def test_entries_survive_reopen(tmp_path):
+    cache = MetadataCache.open(tmp_path)
+    cache.put("vid", {"id": "vid"})
+    cache.close()
+    reopened = MetadataCache.open(tmp_path)
+    assert reopened.get("vid") == {"id": "vid"}
+    reopened.close()
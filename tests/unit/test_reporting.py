@@ -46,3 +46,17 @@ def test_build_session_report_shape():
     assert rep_dict["failures"][0]["videoId"] == "v2"
     assert len(rep_dict["fallbacks"]) == 1
     assert rep_dict["fallbacks"][0]["videoId"] == "v3"
+
+
+def test_report_save_writes_json_bytes(tmp_path):
+    rep = build_session_report(make_session())
+    path = rep.save(tmp_path)
+    assert path.read_bytes() == rep.to_bytes()
+    assert json.loads(path.read_bytes())["counts"] == rep.counts
+
+
+def test_report_to_json_honors_indent_width():
+    rep = build_session_report(make_session())
+    assert '\n    "schema_version"' in rep.to_json(indent=4)
+    assert '\n  "schema_version"' in rep.to_json()
+    assert "\n" not in rep.to_json(indent=None)
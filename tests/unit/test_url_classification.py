@@ -0,0 +1,38 @@
+import pytest
+
+from yt_downloader.downloader import is_single_video_url, video_id_from_url
+
+
+@pytest.mark.parametrize(
+    "url,single",
+    [
+        ("https://www.youtube.com/watch?v=abc", True),
+        ("https://m.youtube.com/watch?feature=share&v=abc", True),
+        ("https://youtu.be/abc?t=30", True),
+        ("https://youtube.com/shorts/abc", True),
+        ("youtube.com/watch?v=abc", True),
+        ("www.youtube.com/shorts/abc", True),
+        ("youtu.be/abc", True),
+        ("www.youtube.com/playlist?list=PL1", False),
+        ("https://www.youtube.com/watch?v=abc&list=PL1", False),
+        ("https://youtu.be/abc?list=PL1", False),
+        ("https://www.youtube.com/playlist?list=PL1", False),
+        ("https://www.youtube.com/@channel/videos", False),
+    ],
+)
+def test_is_single_video_url(url, single):
+    assert is_single_video_url(url) is single
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=3",
+        "https://youtu.be/dQw4w9WgXcQ?si=abc",
+        "https://youtube.com/shorts/dQw4w9WgXcQ",
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+    ],
+)
+def test_video_id_from_url(url):
+    assert video_id_from_url(url) == "dQw4w9WgXcQ"
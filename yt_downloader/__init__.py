@@ -3,9 +3,21 @@
 Public surface kept intentionally small; internal modules may evolve.
 """
 
-from .config import AppConfig
-from .downloader import PlaylistDownloader
-from .plugins import Plugin, PluginManager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .config import AppConfig
+    from .downloader import PlaylistDownloader
+    from .plugins import Plugin, PluginManager
+
+# Public names -> defining submodule. Resolved on first attribute access
+# (PEP 562) so importing the package does not pull in yt-dlp.
+_LAZY_ATTRS = {
+    "AppConfig": ".config",
+    "PlaylistDownloader": ".downloader",
+    "Plugin": ".plugins",
+    "PluginManager": ".plugins",
+}
 
 __all__ = [
     "AppConfig",
@@ -15,6 +27,17 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
 def main():
     """Launch the Textual UI."""
     from .tui import DownloaderApp
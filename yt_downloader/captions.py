@@ -1,8 +1,16 @@
 from __future__ import annotations
 
-import urllib.request
+import asyncio
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Optional, List
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from yt_dlp.utils import sanitize_filename
 from .models import VideoItem, CaptionTrack
 from .logging_utils import get_logger
@@ -13,24 +21,180 @@ except Exception:  # pragma: no cover
     YouTubeTranscriptApi = None  # type: ignore
     TranscriptsDisabled = Exception  # type: ignore
 
+_WATCH_URL = "https://www.youtube.com/watch?v="
+
+# Upper bound for a single subtitle HTTP fetch, in seconds
+SUBTITLE_FETCH_TIMEOUT = 10
+
+# How long extracted video metadata is reused between manual and auto lookups.
+# Kept short: subtitle URLs in the metadata are signed and expire.
+INFO_CACHE_TTL = 300.0
+
+# Worker threads for batch caption fetches (obtain_many / aobtain_many)
+BATCH_MAX_WORKERS = 8
+
+
+def _build_session() -> requests.Session:
+    """HTTP session with keep-alive pooling for subtitle downloads.
+
+    Subtitle URLs for a playlist all point at the same few hosts, so reusing
+    connections skips a TCP+TLS handshake per fetch.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Language codes that don't reduce to their primary subtag
+_LANG_OVERRIDES = {
+    "en-us": "en",
+    "en-gb": "en",
+    "pt-br": "pt-BR",
+}
+
+_VTT_TS_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2})\.(\d{3})")
+
 
 class CaptionsService:
     """Fetch manual and/or auto captions for a video.
 
     Enhanced strategy:
-      1. Attempt yt-dlp native subtitle download (manual captions) with `skip_download`.
-         - Uses `writesubtitles=True`, `writeautomaticsub=False`, `subtitleslangs`.
-         - If native files appear, normalize naming.
-      2. If none produced for requested languages, broaden to ANY available manual subtitle
+      1. Read subtitle metadata once with yt-dlp (no download pipeline) and fetch
+         the requested language's srt (or vtt, converted) URL directly.
+      2. If none matched the requested languages, broaden to ANY available manual subtitle
          if present (language fallback).
       3. If still none AND caller only requested manual (--captions) but not auto,
          fallback automatically to auto captions (graceful upgrade).
       4. Auto captions via youtube-transcript-api.
     """
 
-    def __init__(self, output_dir: Path, languages: Optional[List[str]] = None):
+    def __init__(
+        self,
+        output_dir: Path,
+        languages: Optional[List[str]] = None,
+        session: Optional[requests.Session] = None,
+        force_refresh: bool = False,
+    ):
         self.output_dir = output_dir
         self.languages = languages or ["en"]
+        # When False, a non-empty caption file already on disk is reused as-is
+        self.force_refresh = force_refresh
+        # Auto-caption preference: requested languages, then English
+        self._search_langs = tuple(dict.fromkeys((*self.languages, "en")))
+        # Captions live next to the media; create the directory once up front
+        # rather than probing it on every write
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Pooled HTTP session for subtitle GETs; an injected one is left open
+        self._session = session
+        self._owns_session = session is None
+        # Per-thread yt-dlp handles reused across videos; YoutubeDL is not
+        # thread-safe and is costly to build, so each worker keeps its own
+        self._tls = threading.local()
+        self._ydl_caches: List[dict] = []
+        # video_id -> (monotonic timestamp, info dict)
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+        self._ytt = None  # YouTubeTranscriptApi client, built on first use
+        # Batch worker pool, built on first use and kept for the service's
+        # lifetime so its threads reuse their yt-dlp handles across batches
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the batch pool, cached yt-dlp handles (threads recreate them on demand) and the HTTP session."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # Let running workers finish before their handles are closed
+            executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            caches = list(self._ydl_caches)
+            session = self._session if self._owns_session else None
+            if session is not None:
+                self._session = None
+                self._ytt = None  # rides on the session being closed
+        if session is not None:
+            session.close()
+        for cache in caches:
+            for ydl in list(cache.values()):
+                try:
+                    ydl.close()
+                except Exception:
+                    pass
+            cache.clear()
+
+    def _http(self) -> requests.Session:
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = _build_session()
+        return self._session
+
+    def _batch_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=BATCH_MAX_WORKERS, thread_name_prefix="yt-caps"
+                    )
+        return self._executor
+
+    def _transcript_api(self):
+        """Shared transcript-api client riding on the pooled HTTP session."""
+        if self._ytt is None:
+            session = self._http()
+            with self._lock:
+                if self._ytt is None:
+                    self._ytt = YouTubeTranscriptApi(http_client=session)  # type: ignore[misc]
+        return self._ytt
+
+    def _get_info(self, video_id: str) -> Optional[dict]:
+        """Metadata for ``video_id``, extracted at most once per INFO_CACHE_TTL."""
+        now = time.monotonic()
+        with self._lock:
+            hit = self._info_cache.get(video_id)
+        if hit is not None and now - hit[0] < INFO_CACHE_TTL:
+            return hit[1]
+        info = self._get_ydl().extract_info(_WATCH_URL + video_id, download=False)
+        if info:
+            with self._lock:
+                self._info_cache[video_id] = (now, info)
+        return info
+
+    def prime_info(self, video_id: str, info: dict) -> None:
+        """Seed the metadata cache with info already extracted by the caller.
+
+        The downloader extracts every video's full info dict (subtitle maps
+        included) before downloading it, so captions can reuse that instead of
+        fetching the watch page a second time.
+        """
+        with self._lock:
+            self._info_cache[video_id] = (time.monotonic(), info)
+
+    def _get_ydl(self):
+        """Return the calling thread's metadata-only YoutubeDL (manual and auto paths)."""
+        import yt_dlp
+
+        cache = getattr(self._tls, "ydls", None)
+        if cache is None:
+            cache = self._tls.ydls = {}
+            with self._lock:
+                self._ydl_caches.append(cache)
+        ydl = cache.get("meta")
+        if ydl is None:
+            ydl = cache["meta"] = yt_dlp.YoutubeDL(  # type: ignore[arg-type]
+                {
+                    "quiet": True,
+                    "no_warnings": True,
+                    "writesubtitles": False,
+                    "writeautomaticsub": False,
+                }
+            )
+        return ydl
 
     # --- Helpers (naming / language canonicalization) ----------------
     def _caption_base_name(self, video: VideoItem) -> str:
@@ -40,11 +204,12 @@ class CaptionsService:
           - If playlist logic assigned video.filename (templated), use its stem.
           - Otherwise fall back to sanitized video.title (single video mode).
         """
-        if getattr(video, "filename", None):
+        if video.filename:
             return sanitize_filename(Path(video.filename).stem)
         return sanitize_filename(video.title)
 
-    def _canonical_lang(self, lang: str) -> str:
+    @staticmethod
+    def _canonical_lang(lang: str) -> str:
         """
         Canonicalize language codes:
           - en-US / en-GB -> en
@@ -54,13 +219,8 @@ class CaptionsService:
         if not lang:
             return "en"
         l = lang.lower()
-        overrides = {
-            "en-us": "en",
-            "en-gb": "en",
-            "pt-br": "pt-BR",
-        }
-        if l in overrides:
-            return overrides[l]
+        if l in _LANG_OVERRIDES:
+            return _LANG_OVERRIDES[l]
         if "-" in l:
             return l.split("-")[0]
         return l
@@ -69,106 +229,15 @@ class CaptionsService:
     def fetch_manual(self, video: VideoItem) -> Optional[CaptionTrack]:
         """Fetch manual (human) captions; broaden language search if needed."""
         log = get_logger()
+        existing = self._existing_track(video, self.languages, "manual")
+        if existing:
+            log.info("Reusing manual caption already on disk: %s", existing.path)
+            return existing
         try:
-            import yt_dlp
-
-            # Store alongside video file (no separate captions directory)
-            base_dir = self.output_dir
-            base_name = self._caption_base_name(video)
-
-            # Native attempt (skip media, write subtitles only)
-            native_opts = {
-                "quiet": True,
-                "no_warnings": True,
-                "skip_download": True,
-                "writesubtitles": True,
-                "writeautomaticsub": False,
-                "subtitleslangs": self.languages,
-                "subtitlesformat": "srt/best",
-                "outtmpl": str(base_dir / "%(id)s"),
-            }
-
-            native_written = False
-            try:
-                with yt_dlp.YoutubeDL(native_opts) as ydl:
-                    # extract_info first (metadata), then explicit download to trigger subtitle write
-                    ydl.extract_info(
-                        f"https://www.youtube.com/watch?v={video.video_id}",
-                        download=False,
-                    )
-                    # Trigger subtitle write without media (skip_download True)
-                    ydl.download([f"https://www.youtube.com/watch?v={video.video_id}"])
-                    native_written = True
-                    log.info("Native subtitles written for video %s", video.video_id)
-            except Exception:
-                native_written = False  # fall through to legacy path
-                log.info("Native subtitles not written for video %s", video.video_id)
-
-            if native_written:
-                # Try requested languages first
-                for lang in self.languages:
-                    cand = base_dir / f"{video.video_id}.{lang}.srt"
-                    if cand.exists():
-                        lang_c = self._canonical_lang(lang)
-                        canonical = base_dir / f"{base_name}.{lang_c}.manual.srt"
-                        if cand != canonical:
-                            try:
-                                cand.rename(canonical)
-                            except OSError:
-                                canonical.write_text(
-                                    cand.read_text(encoding="utf-8"), encoding="utf-8"
-                                )
-                        log.info("Native subtitle file found: %s", canonical)
-                        return CaptionTrack(
-                            video_id=video.video_id,
-                            language=lang,
-                            kind="manual",
-                            format="srt",
-                            path=str(canonical),
-                        )
-                # Broader fallback: pick any manual subtitle file if requested languages absent
-                for path in base_dir.glob(f"{video.video_id}.*.srt"):
-                    parts = path.name.split(".")
-                    if len(parts) >= 3 and parts[-2] != "manual":
-                        # path pattern: <id>.<lang>.srt (add manual tag)
-                        raw_lang = parts[-2]
-                        lang_c = self._canonical_lang(raw_lang)
-                        canonical = base_dir / f"{base_name}.{lang_c}.manual.srt"
-                        if path != canonical:
-                            try:
-                                path.rename(canonical)
-                            except OSError:
-                                canonical.write_text(
-                                    path.read_text(encoding="utf-8"), encoding="utf-8"
-                                )
-                        log.info(
-                            "Using fallback manual subtitle language '%s' for video %s",
-                            lang,
-                            video.video_id,
-                        )
-                        log.info("Native subtitle file found: %s", canonical)
-                        return CaptionTrack(
-                            video_id=video.video_id,
-                            language=lang,
-                            kind="manual",
-                            format="srt",
-                            path=str(canonical),
-                        )
-
-            # Legacy metadata-based retrieval
-            legacy_opts = {
-                "quiet": True,
-                "no_warnings": True,
-                "writesubtitles": False,
-                "writeautomaticsub": False,
-            }
-
-            with yt_dlp.YoutubeDL(legacy_opts) as ydl:  # type: ignore
-                info = ydl.extract_info(
-                    f"https://www.youtube.com/watch?v={video.video_id}", download=False
-                )
+            # Metadata-based retrieval: subtitle URLs are fetched directly
+            info = self._get_info(video.video_id)
             if not info:
-                log.info("No info returned for manual subtitles (legacy path) for video %s", video.video_id)
+                log.info("No info returned for manual subtitles for video %s", video.video_id)
                 return None
             subs = info.get("subtitles") or {}
             log.info("Available subtitle languages for video %s: %s", video.video_id, list(subs.keys()) if subs else "None")
@@ -176,56 +245,195 @@ class CaptionsService:
                 log.info("No manual subtitles advertised in metadata for video %s", video.video_id)
                 return None
 
-            # Try requested languages first
-            for lang in self.languages:
-                if lang not in subs:
-                    log.info("Requested language %s not available for video %s", lang, video.video_id)
-                    continue
-                track = self._download_subtitle_entry(video, lang, subs[lang])
+            # Try requested languages first (user order, intersected up front)
+            wanted = [lang for lang in self.languages if lang in subs]
+            if not wanted:
+                log.info("Requested languages %s not available for video %s", self.languages, video.video_id)
+            elif len(wanted) == 1:
+                # Nothing to race: stream the single candidate straight to disk
+                track = self._download_subtitle_entry(video, wanted[0], subs[wanted[0]])
                 if track:
+                    log.info("Manual subtitle found and downloaded for lang %s", wanted[0])
+                    return track
+            else:
+                found = self._fetch_first(video, wanted, subs)
+                if found:
+                    lang, content = found
+                    track = self._store_subtitle(video, lang, "manual", content)
                     log.info("Manual subtitle found and downloaded for lang %s", lang)
                     return track
 
-            # Broaden to any available language if none matched
-            for lang, entries in subs.items():
-                log.info("Trying broadened language %s for video %s", lang, video.video_id)
-                track = self._download_subtitle_entry(video, lang, entries)
-                if track:
-                    log.info(
-                        "Broadened to available manual subtitle language '%s' for %s",
-                        lang,
-                        video.video_id,
-                    )
-                    return track
+            # Broaden to any other available language if none matched
+            rest = {lang: entries for lang, entries in subs.items() if lang not in wanted}
+            log.info("Trying broadened languages %s for video %s", list(rest), video.video_id)
+            found = self._fetch_any(video, rest)
+            if found:
+                lang, content = found
+                track = self._store_subtitle(video, lang, "manual", content)
+                log.info(
+                    "Broadened to available manual subtitle language '%s' for %s",
+                    lang,
+                    video.video_id,
+                )
+                return track
 
         except Exception as e:  # pragma: no cover
             log.debug("Manual caption fetch failed: %s", e)
             return None
         return None
 
+    def _existing_track(
+        self, video: VideoItem, langs, kind: str
+    ) -> Optional[CaptionTrack]:
+        """Return a track for a caption file from an earlier run, if one exists.
+
+        One stat() per candidate instead of a metadata extraction.
+        """
+        if self.force_refresh:
+            return None
+        base_name = self._caption_base_name(video)
+        for lang in langs:
+            lang_c = self._canonical_lang(lang)
+            path = self.output_dir / f"{base_name}.{lang_c}.{kind}.srt"
+            try:
+                if path.stat().st_size > 0:
+                    return CaptionTrack(
+                        video_id=video.video_id,
+                        language=lang_c,
+                        kind=kind,
+                        format="srt",
+                        path=str(path),
+                    )
+            except OSError:
+                continue
+        return None
+
+    def _fetch_first(
+        self, video: VideoItem, langs: List[str], subs: dict
+    ) -> Optional[tuple[str, bytes]]:
+        """Fetch candidate languages in ``langs`` order; return the first hit.
+
+        Sequential on purpose: the top-priority language usually exists, so
+        fetching the rest in parallel would mostly be wasted requests.
+        """
+        for lang in langs:
+            content = self._fetch_subtitle_entry(video, lang, subs[lang])
+            if content is not None:
+                return lang, content
+        return None
+
+    def _fetch_any(
+        self, video: VideoItem, subs: dict, max_workers: int = 4
+    ) -> Optional[tuple[str, bytes]]:
+        """Fetch the given languages concurrently; return the first hit in ``subs`` order.
+
+        Used for the broadened search. Results are taken in the order the
+        languages are advertised, not completion order, so repeated runs pick
+        the same language. The pool is kept small so a video advertising
+        dozens of languages doesn't fire them all at once.
+        """
+        if not subs:
+            return None
+        pool = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(subs)), thread_name_prefix="yt-subs"
+        )
+        try:
+            futures = [
+                (lang, pool.submit(self._fetch_subtitle_entry, video, lang, entries))
+                for lang, entries in subs.items()
+            ]
+            for lang, fut in futures:
+                try:
+                    content = fut.result()
+                except Exception as e:
+                    # One broken track must not end the search for the others
+                    get_logger().debug("Subtitle fetch failed for lang %s: %s", lang, e)
+                    continue
+                if content is not None:
+                    return lang, content
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return None
+
     def _download_subtitle_entry(
         self, video: VideoItem, lang: str, entries, kind: str = "manual"
     ) -> Optional[CaptionTrack]:
-        """Pick best entry (prefer srt/vtt) and store as caption of given kind (manual/auto)."""
+        """Pick best entry (prefer srt/vtt) and store as caption of given kind (manual/auto).
+
+        Only vtt needs converting; anything else is stored as served, so it is
+        streamed from the response straight into the caption file instead of
+        being buffered in memory.
+        """
+        best = self._pick_entry(entries)
+        if best and best.get("ext") != "vtt":
+            return self._stream_subtitle(video, lang, kind, best)
+        content = self._fetch_subtitle_entry(video, lang, entries, kind)
+        if content is None:
+            return None
+        return self._store_subtitle(video, lang, kind, content)
+
+    def _pick_entry(self, entries) -> Optional[dict]:
+        # Index once by ext (first entry wins); srt first since it needs no conversion
+        by_ext: dict = {}
+        for sub in entries:
+            by_ext.setdefault(sub.get("ext"), sub)
+        return by_ext.get("srt") or by_ext.get("vtt") or (entries[0] if entries else None)
+
+    def _stream_subtitle(
+        self, video: VideoItem, lang: str, kind: str, entry: dict
+    ) -> Optional[CaptionTrack]:
         log = get_logger()
         log.info("Downloading subtitle entry for video %s lang %s (kind=%s)", video.video_id, lang, kind)
-        best = None
-        for sub in entries:
-            if sub.get("ext") in ("srt", "vtt"):
-                best = sub
-                break
-        if not best and entries:
-            best = entries[0]
+        lang_c = self._canonical_lang(lang)
+        path = self._caption_path(self._caption_base_name(video), lang_c, kind)
+        try:
+            with self._http().get(entry["url"], stream=True, timeout=SUBTITLE_FETCH_TIMEOUT) as resp:
+                resp.raise_for_status()
+                with path.open("wb") as fh:
+                    for chunk in resp.iter_content(64 * 1024):
+                        fh.write(chunk)
+        except Exception as e:
+            log.error("Failed to download subtitle from %s for video %s: %s", entry.get("url"), video.video_id, e)
+            path.unlink(missing_ok=True)
+            return None
+        log.info("Subtitle file written: %s", path)
+        return CaptionTrack(
+            video_id=video.video_id,
+            language=lang_c,
+            kind=kind,
+            format="srt",
+            path=str(path),
+        )
+
+    def _fetch_subtitle_entry(
+        self, video: VideoItem, lang: str, entries, kind: str = "manual"
+    ) -> Optional[bytes]:
+        """Download the best entry (srt, then vtt) and return it as UTF-8 SRT bytes."""
+        log = get_logger()
+        log.info("Downloading subtitle entry for video %s lang %s (kind=%s)", video.video_id, lang, kind)
+        best = self._pick_entry(entries)
         if not best:
             return None
         try:
-            with urllib.request.urlopen(best["url"]) as resp:
-                content = resp.read().decode("utf-8")
+            resp = self._http().get(best["url"], timeout=SUBTITLE_FETCH_TIMEOUT)
+            resp.raise_for_status()
+            content = resp.content
         except Exception as e:
             log.error("Failed to download subtitle from %s for video %s: %s", best.get("url"), video.video_id, e)
             return None
+        # Only a format conversion needs the text; anything else passes through as bytes
         if best.get("ext") == "vtt":
-            content = self._vtt_to_srt(content)
+            try:
+                content = self._vtt_to_srt(content.decode("utf-8")).encode("utf-8")
+            except Exception as e:
+                log.error("Failed to convert VTT subtitle for video %s lang %s: %s", video.video_id, lang, e)
+                return None
+        return content
+
+    def _store_subtitle(
+        self, video: VideoItem, lang: str, kind: str, content: bytes
+    ) -> CaptionTrack:
+        log = get_logger()
         base_name = self._caption_base_name(video)
         lang_c = self._canonical_lang(lang)
         path = self._write_caption(base_name, lang_c, kind, content)
@@ -245,20 +453,14 @@ class CaptionsService:
         """
         log = get_logger()
         log.info("Fetching auto captions for video %s", video.video_id)
+        existing = self._existing_track(video, self._search_langs, "auto")
+        if existing:
+            log.info("Reusing auto caption already on disk: %s", existing.path)
+            return existing
         # --- Step 1: yt-dlp automatic_captions field
         try:
-            import yt_dlp  # local import
-            extract_opts: dict[str, Any] = {
-                "quiet": True,
-                "no_warnings": True,
-                "skip_unavailable_fragments": True,
-                "extract_flat": False,
-            }
-            with yt_dlp.YoutubeDL(extract_opts) as ydl:  # type: ignore
-                info = ydl.extract_info(
-                    f"https://www.youtube.com/watch?v={video.video_id}",
-                    download=False,
-                )
+            # Same per-thread handle as fetch_manual: metadata only, no download
+            info = self._get_info(video.video_id)
             if info:
                 auto_map = info.get("automatic_captions") or {}
                 log.info(
@@ -266,16 +468,15 @@ class CaptionsService:
                     video.video_id,
                     list(auto_map.keys()) if auto_map else "None",
                 )
-                search_langs = list(dict.fromkeys(self.languages + ["en"]))  # preserve order, ensure 'en' fallback
-                for lang in search_langs:
-                    if lang in auto_map:
-                        log.info("Trying yt-dlp automatic captions lang=%s for %s", lang, video.video_id)
-                        track = self._download_subtitle_entry(
-                            video, lang, auto_map[lang], kind="auto"
-                        )
-                        if track:
-                            log.info("Auto subtitle (yt-dlp) obtained for lang %s", lang)
-                            return track
+                # Later candidates are only tried if an earlier download fails
+                for lang in (l for l in self._search_langs if l in auto_map):
+                    log.info("Trying yt-dlp automatic captions lang=%s for %s", lang, video.video_id)
+                    track = self._download_subtitle_entry(
+                        video, lang, auto_map[lang], kind="auto"
+                    )
+                    if track:
+                        log.info("Auto subtitle (yt-dlp) obtained for lang %s", lang)
+                        return track
             else:
                 log.info("No info object from yt-dlp for auto captions %s", video.video_id)
         except Exception as e:
@@ -283,34 +484,24 @@ class CaptionsService:
         # --- Step 2: youtube-transcript-api fallback
         if YouTubeTranscriptApi is not None:
             try:
-                # Build language preference list with fallback to English
-                search_langs = list(dict.fromkeys(self.languages + ["en"]))
-                for lang in search_langs:
-                    log.info("Attempting youtube-transcript-api for %s lang=%s", video.video_id, lang)
-                    try:
-                        transcript = YouTubeTranscriptApi.get_transcript(video.video_id, languages=[lang])  # type: ignore
-                    except TranscriptsDisabled:  # type: ignore
-                        log.info("Transcripts disabled for %s", video.video_id)
-                        return None
-                    except Exception:
-                        continue
+                search_langs = self._search_langs
+                log.info("Attempting youtube-transcript-api for %s langs=%s", video.video_id, search_langs)
+                try:
+                    # One listing request; the preferred language is picked locally
+                    transcript_list = self._transcript_api().list(video.video_id)
+                except TranscriptsDisabled:  # type: ignore
+                    log.info("Transcripts disabled for %s", video.video_id)
+                    return None
+                try:
+                    found = transcript_list.find_transcript(search_langs)
+                except Exception:
+                    found = None
+                if found is not None:
+                    transcript = found.fetch()
                     if transcript:
-                        # Build SRT content
-                        lines = []
-                        for idx, seg in enumerate(transcript, start=1):
-                            start = float(seg.get("start", 0.0))
-                            end = start + float(seg.get("duration", 0.0))
-                            lines.append(str(idx))
-                            lines.append(f"{self._format_ts(start)} --> {self._format_ts(end)}")
-                            text = seg.get("text", "").replace("\n", " ").strip()
-                            if not text:
-                                text = "[NO TEXT]"
-                            lines.append(text)
-                            lines.append("")
-                        content = "\n".join(lines)
-                        base_name = self._caption_base_name(video)
-                        lang_c = self._canonical_lang(lang)
-                        path = self._write_caption(base_name, lang_c, "auto", content)
+                        lang_c = self._canonical_lang(found.language_code)
+                        path = self._caption_path(self._caption_base_name(video), lang_c, "auto")
+                        self._write_transcript(path, transcript)
                         log.info("Auto caption (transcript-api) written: %s", path)
                         return CaptionTrack(
                             video_id=video.video_id,
@@ -328,6 +519,58 @@ class CaptionsService:
 
     def obtain(
         self, video: VideoItem, want_manual: bool, want_auto: bool
+    ) -> List[CaptionTrack]:
+        try:
+            return self._obtain(video, want_manual, want_auto)
+        finally:
+            # Manual and auto lookups share the cached metadata; once both are
+            # done it is dead weight (formats lists are large), so evict it
+            with self._lock:
+                self._info_cache.pop(video.video_id, None)
+
+    def obtain_many(
+        self, videos: List[VideoItem], want_manual: bool, want_auto: bool
+    ) -> List[List[CaptionTrack]]:
+        """Obtain captions for many videos concurrently; results follow input order.
+
+        Runs on the service's batch pool, whose workers share the pooled HTTP
+        session and each keep one yt-dlp handle across calls.
+        """
+        if not videos:
+            return []
+        pool = self._batch_executor()
+        return list(pool.map(lambda v: self.obtain(v, want_manual, want_auto), videos))
+
+    async def aobtain_many(
+        self,
+        videos: List[VideoItem],
+        want_manual: bool,
+        want_auto: bool,
+        limit: int = BATCH_MAX_WORKERS,
+    ) -> List[List[CaptionTrack]]:
+        """Async counterpart of :meth:`obtain_many`; results follow input order.
+
+        yt-dlp, the subtitle GETs and transcript-api are all blocking, so each
+        video is handed to the batch pool via ``run_in_executor`` rather than
+        the loop's default executor. At most ``limit`` videos are in flight at
+        once, so a large playlist doesn't queue its whole backlog on the pool.
+        """
+        if not videos:
+            return []
+        loop = asyncio.get_running_loop()
+        pool = self._batch_executor()
+        gate = asyncio.Semaphore(max(1, limit))
+
+        async def one(video: VideoItem) -> List[CaptionTrack]:
+            async with gate:
+                return await loop.run_in_executor(
+                    pool, self.obtain, video, want_manual, want_auto
+                )
+
+        return list(await asyncio.gather(*(one(v) for v in videos)))
+
+    def _obtain(
+        self, video: VideoItem, want_manual: bool, want_auto: bool
     ) -> List[CaptionTrack]:
         log = get_logger()
         log.info("Obtaining captions for video %s: manual=%s, auto=%s", video.video_id, want_manual, want_auto)
@@ -357,44 +600,73 @@ class CaptionsService:
         return tracks
 
     # --- Internal helpers -------------------------------------------
-    def _write_caption(self, base_name: str, lang: str, kind: str, content: str) -> Path:
-        base_dir = self.output_dir
-        base_dir.mkdir(parents=True, exist_ok=True)
-        filename = f"{base_name}.{lang}.{kind}.srt"
-        path = base_dir / filename
-        path.write_text(content, encoding="utf-8")
+    def _caption_path(self, base_name: str, lang: str, kind: str) -> Path:
+        return self.output_dir / f"{base_name}.{lang}.{kind}.srt"
+
+    def _write_caption(self, base_name: str, lang: str, kind: str, content: bytes) -> Path:
+        path = self._caption_path(base_name, lang, kind)
+        # Content arrives pre-encoded; write raw bytes (no TextIOWrapper in between)
+        path.write_bytes(content)
         return path
 
-    def _format_ts(self, seconds: float) -> str:
-        hrs = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds - int(seconds)) * 1000)
-        return f"{hrs:02d}:{mins:02d}:{secs:02d},{millis:03d}"
+    def _write_transcript(self, path: Path, transcript) -> None:
+        """Write transcript snippets (``start``/``duration``/``text``) to ``path`` as SRT.
+
+        Streams to the file handle rather than joining the whole SRT in memory,
+        which matters for multi-hour auto transcripts.
+        """
+        fmt = self._format_ts
+        with path.open("w", encoding="utf-8", newline="") as fh:
+            for idx, seg in enumerate(transcript, start=1):
+                start = float(seg.start)
+                end = start + float(seg.duration)
+                text = (seg.text or "").replace("\n", " ").strip()
+                if not text:
+                    text = "[NO TEXT]"
+                if idx > 1:
+                    fh.write("\n")  # blank line between cues
+                fh.write(f"{idx}\n{fmt(start)} --> {fmt(end)}\n{text}\n")
 
-    def _vtt_to_srt(self, vtt_content: str) -> str:
-        """Convert WebVTT format to SRT format."""
-        import re
+    @staticmethod
+    def _format_ts(seconds: float) -> str:
+        secs, millis = divmod(int(seconds * 1000 + 0.5), 1000)
+        if secs < 3600:  # most videos are under an hour: skip the hour split
+            mins, secs = divmod(secs, 60)
+            return "00:%02d:%02d,%03d" % (mins, secs, millis)
+        mins, secs = divmod(secs, 60)
+        hrs, mins = divmod(mins, 60)
+        return "%02d:%02d:%02d,%03d" % (hrs, mins, secs, millis)
 
-        lines = vtt_content.split("\n")
-        srt_lines = []
+    @staticmethod
+    def _vtt_to_srt(vtt_content: str) -> str:
+        """Convert WebVTT format to SRT format.
+
+        Single pass: ``timestamp`` is None while looking for the next cue
+        header, otherwise the cue's text lines are being collected.
+        """
+        srt_lines: List[str] = []
         counter = 1
-        for i, line in enumerate(lines):
-            if "-->" in line:
-                timestamp_line = re.sub(
-                    r"(\d{2}):(\d{2}):(\d{2})\.(\d{3})", r"\1:\2:\3,\4", line
-                )
-                srt_lines.append(str(counter))
-                srt_lines.append(timestamp_line)
-                text_lines = []
-                j = i + 1
-                while j < len(lines) and lines[j].strip() and "-->" not in lines[j]:
-                    text_lines.append(lines[j].strip())
-                    j += 1
-                if text_lines:
-                    srt_lines.extend(text_lines)
-                    srt_lines.append("")
-                    counter += 1
+        timestamp: Optional[str] = None
+        text: List[str] = []
+        for line in vtt_content.splitlines():
+            if timestamp is None:
+                if "-->" in line:
+                    timestamp = _VTT_TS_RE.sub(r"\1:\2:\3,\4", line)
+                continue
+            stripped = line.strip()
+            if stripped and "-->" not in line:
+                text.append(stripped)
+                continue
+            # Blank line or a new header ends the current cue
+            if text:
+                srt_lines.extend((str(counter), timestamp, *text, ""))
+                counter += 1
+                text = []
+            timestamp = (
+                _VTT_TS_RE.sub(r"\1:\2:\3,\4", line) if "-->" in line else None
+            )
+        if timestamp is not None and text:
+            srt_lines.extend((str(counter), timestamp, *text, ""))
         return "\n".join(srt_lines)
 
 
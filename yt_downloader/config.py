@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import copy
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, List
 
 DEFAULT_QUALITY_ORDER = ["1080p", "720p", "480p", "360p", "240p", "144p"]
+# Fallback chain for each known preference: the preferred quality, then the rest
+QUALITY_ORDER_BY_PREF = {
+    q: (q, *DEFAULT_QUALITY_ORDER[:i], *DEFAULT_QUALITY_ORDER[i + 1 :])
+    for i, q in enumerate(DEFAULT_QUALITY_ORDER)
+}
+# Parallel videos by default. Each one also opens fragment_concurrency
+# connections, so keep this low enough to stay clear of YouTube throttling;
+# users can raise it via the Jobs field / config file.
+DEFAULT_MAX_CONCURRENCY = 4
 
 
 @dataclass
@@ -15,8 +26,11 @@ class AppConfig:
     quality_order: List[str] = field(
         default_factory=lambda: DEFAULT_QUALITY_ORDER.copy()
     )
-    max_concurrency: int = 4
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    fragment_concurrency: int = 4  # parallel fragment connections per video
+    segments_per_video: int = 1  # parallel byte-range connections per file (needs aria2c)
     timeout_seconds: int = 10
+    metadata_cache_ttl: int = 3600  # seconds extracted info is reused on disk; 0 disables
     output_dir: Path = field(default_factory=lambda: Path.home() / 'Downloads' / 'yt_downloads')
     audio_only: bool = False
     retry_attempts: int = 2
@@ -33,27 +47,54 @@ class AppConfig:
         if not isinstance(self.output_dir, Path):
             self.output_dir = Path(self.output_dir)
 
+    @staticmethod
+    def quality_order_for(preferred: str) -> List[str]:
+        """Quality fallback chain starting at ``preferred``."""
+        order = QUALITY_ORDER_BY_PREF.get(preferred)
+        if order is None:
+            return [preferred, *DEFAULT_QUALITY_ORDER]
+        return list(order)
+
     def preferred(self) -> str:
         return self.quality_order[0]
 
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready copy of the fields, safe to keep as a snapshot.
+
+        The dataclass is flat, so copying the list fields is enough to detach
+        the result from later mutation of this config.
+        """
+        data = {k: list(v) if isinstance(v, list) else v for k, v in vars(self).items()}
+        data["output_dir"] = str(self.output_dir)
+        return data
+
     def save(self, path: Path) -> None:
         """Saves the configuration to a JSON file."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(asdict(self), f, indent=2, cls=PathEncoder)
+        data = self.to_dict()
+        try:
+            f = open(path, "w")
+        except FileNotFoundError:
+            # Only the first save needs the parent created
+            path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(path, "w")
+        with f:
+            json.dump(data, f, indent=2)
 
     @classmethod
     def from_file(cls, path: Path) -> "AppConfig":
         """Loads configuration from a JSON file."""
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return cls()
-        with open(path, "r") as f:
-            data = json.load(f)
-        return cls(**data)
+        data = _load_config_cached(str(path), st.st_mtime_ns, st.st_size)
+        # Copy so callers mutating list fields cannot corrupt the cached dict
+        return cls(**copy.deepcopy(data))
+
 
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime/size are part of the key only, so an edited file misses the cache
+    with open(path, "rb") as f:
+        return json.load(f)
 
-class PathEncoder(json.JSONEncoder):
-    def default(self, o: Any) -> Any:
-        if isinstance(o, Path):
-            return str(o)
-        return super().default(o)
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from itertools import count
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
+import logging
+import re
 import time
 import os
 import shutil
-import glob
-from typing import Optional, Any, List, Dict, Callable
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Optional, Any, List, Dict, Callable
+from urllib.parse import parse_qs, urlsplit
 from yt_dlp.utils import sanitize_filename
 from yt_dlp.utils import (
     DownloadError,
@@ -21,19 +35,109 @@ from yt_dlp.utils import (
 )
 
 import yt_dlp
-from rich.progress import Progress, BarColumn, DownloadColumn, TimeRemainingColumn  # type: ignore
 
 from .config import AppConfig
-from .models import PlaylistSession, VideoItem, CaptionTrack
+from .models import PlaylistSession, VideoItem
 from .naming import expand_template
 from .manifest import Manifest
 from .filtering import apply_filters
 from .captions import CaptionsService
-from .logging_utils import get_logger
+from .metadata_cache import MetadataCache
+from .logging_utils import echo, get_logger
 from uuid import uuid4
 from datetime import datetime
 
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.progress import Progress
+
 RETRIES = 3  # Centralized retry constant
+# Fixed read block size for yt-dlp's HTTP downloader; each block is written
+# straight to the .part file, so per-worker memory stays bounded regardless of
+# video size (noresizebuffer keeps yt-dlp from re-tuning it per block)
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+# Minimum byte delta between progress updates pushed to Rich / the TUI callback
+PROGRESS_FLUSH_BYTES = 1 << 20
+# Private info-dict key carrying the per-download progress token; yt-dlp
+# copies it into the info_dict it hands to progress hooks
+PROGRESS_TOKEN_KEY = "_yt_pilot_progress"
+
+# Known quality labels -> pixel height (built once, looked up per video)
+QUALITY_HEIGHTS: Dict[str, int] = {
+    "144p": 144,
+    "240p": 240,
+    "360p": 360,
+    "480p": 480,
+    "720p": 720,
+    "1080p": 1080,
+    "1440p": 1440,
+    "2160p": 2160,
+}
+# (height, label) pairs, tallest first, for mapping a numeric height to a label
+QUALITY_THRESHOLDS = tuple(
+    sorted(((h, q) for q, h in QUALITY_HEIGHTS.items()), reverse=True)
+)
+# Errors from the on-disk metadata cache; it is only an optimisation, so
+# these never fail a download
+METADATA_CACHE_ERRORS = (sqlite3.Error, TypeError, ValueError)
+# vcodec markers of formats without a video track (audio, storyboards)
+NO_VIDEO_CODECS = frozenset({"none"})
+
+
+def _drop_page_cache(path: str) -> None:
+    """Hint the kernel to evict a finished media file from the page cache.
+
+    Downloads are written once and never re-read by this process, so keeping
+    them cached only squeezes other workloads during large playlist runs.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# Video id in watch (?v= / &v=), youtu.be, Shorts, embed and live URLs
+_VIDEO_ID_RE = re.compile(
+    r"(?:[?&]v=|youtu\.be/|/shorts/|/embed/|/live/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+
+
+def video_id_from_url(url: str) -> str:
+    """Extract the 11-character video id from any single-video URL form."""
+    m = _VIDEO_ID_RE.search(url)
+    if m:
+        return m.group(1)
+    return url.rstrip("/").rsplit("/", 1)[-1].split("?", 1)[0]
+
+
+def is_single_video_url(url: str) -> bool:
+    """Whether ``url`` names one video rather than a playlist.
+
+    Single videos are watch URLs without ``list=``, youtu.be short links
+    (optionally with extra query params) and Shorts URLs. The URL is parsed
+    once so every caller dispatching targets classifies them the same way.
+    """
+    # Without a scheme urlsplit puts the host into the path
+    if "://" not in url:
+        url = "https://" + url
+    parts = urlsplit(url)
+    path = parts.path
+    if path.startswith("/shorts/"):
+        return True
+    query = parse_qs(parts.query)
+    if "list" in query:
+        return False
+    if path == "/watch":
+        return "v" in query
+    return parts.netloc.endswith("youtu.be") and len(path) > 1
+
 
 # --- Helper components (refactored architecture) ---------------------------------
 
@@ -81,40 +185,15 @@ class FormatSelector:
 
     @staticmethod
     def _q_to_h(q: str) -> int:
+        height = QUALITY_HEIGHTS.get(q)
+        if height is not None:
+            return height
         try:
             return int(q.replace("p", "").strip())
         except Exception:
             return 720
 
 
-class CaptionOrchestrator:
-    """
-    Unified caption retrieval using a single info dict (if supplied) to decide what to fetch.
-    """
-
-    def __init__(self, service_factory):
-        self._make_service = (
-            service_factory  # expects (languages:list[str]) -> CaptionsService
-        )
-
-    def run(
-        self,
-        video,
-        output_dir: Path,
-        info: dict,
-        want_manual: bool,
-        want_auto: bool,
-        languages: list[str],
-    ) -> list[CaptionTrack]:
-        from .captions import CaptionsService  # local import to avoid cycles
-
-        tracks: list[CaptionTrack] = []
-        service = self._make_service(languages)
-        # Leverage existing service obtain (already has graceful fallback logic)
-        tracks.extend(service.obtain(video, want_manual, want_auto))
-        return tracks
-
-
 @dataclass
 class VideoResult:
     url: str
@@ -126,6 +205,7 @@ class VideoResult:
     duration: Optional[float] = None
     resolution: Optional[str] = None
     filepath: Optional[str] = None
+    size_bytes: Optional[int] = None
 
 
 class PlaylistDownloader:
@@ -135,15 +215,88 @@ class PlaylistDownloader:
         self.config = config
         self.plugin_manager = plugin_manager
         self.progress_callback = progress_callback
-        self.progress = Progress(
+        # Track last completed session for enrichment
+        self.last_session: PlaylistSession | None = None
+        # Per-worker yt-dlp handles (YoutubeDL is not thread-safe, so each
+        # thread keeps its own and reuses it for every video it processes)
+        self._tls = threading.local()
+        self._ydl_caches: list[dict] = []
+        self._ydl_lock = threading.Lock()
+        # Per-download progress state ([rich task id, flushed bytes]) keyed by
+        # a token unique to each download call, so the same video appearing
+        # twice in a playlist gets two slots. yt-dlp calls progress hooks from
+        # its own fragment threads when concurrent_fragment_downloads > 1, so
+        # thread-locals won't do.
+        self._progress_state: dict[int, list] = {}
+        self._progress_lock = threading.Lock()
+        self._progress_tokens = count(1)
+        # Worker pool shared by every playlist processed with this downloader
+        self._executor: ThreadPoolExecutor | None = None
+        # Caption services keyed by (output dir, languages, force) so their cached
+        # yt-dlp handles are reused across videos
+        self._caption_services: dict[tuple, CaptionsService] = {}
+        # On-disk info caches keyed by output dir (None when unavailable)
+        self._metadata_caches: dict[str, MetadataCache | None] = {}
+        # JSON-ready copy of the config, built once and shared by every session
+        self._config_snapshot: dict[str, Any] | None = None
+
+    def _snapshot_config(self) -> dict[str, Any]:
+        if self._config_snapshot is None:
+            self._config_snapshot = self.config.to_dict()
+        return self._config_snapshot
+
+    @cached_property
+    def progress(self) -> "Progress":
+        # Rich is only imported once a download actually reports progress
+        from rich.progress import (  # type: ignore
+            BarColumn,
+            DownloadColumn,
+            Progress,
+            TimeRemainingColumn,
+        )
+
+        return Progress(
             BarColumn(),
             "[progress.percentage]{task.percentage:>3.0f}%",
             DownloadColumn(),
             TimeRemainingColumn(),
+            refresh_per_second=8,
+            transient=True,
         )
-        # Track last completed session + last selected format for enrichment
-        self.last_session: PlaylistSession | None = None
-        self._last_selected_format: dict | None = None
+
+    def close(self) -> None:
+        """Release pooled yt-dlp handles (and their HTTP connections).
+
+        Handles are kept alive across download_playlist/download_video calls so
+        multi-target runs reuse warm connections; call this once finished.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._close_ydls()
+        with self._ydl_lock:
+            services = list(self._caption_services.values())
+            self._caption_services.clear()
+        for service in services:
+            service.close()
+        with self._ydl_lock:
+            caches = [c for c in self._metadata_caches.values() if c is not None]
+            self._metadata_caches.clear()
+        for cache in caches:
+            cache.close()
+
+    def __enter__(self) -> "PlaylistDownloader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config.max_concurrency, thread_name_prefix="yt-dl"
+            )
+        return self._executor
 
     def _normalize_video_url(self, url: str) -> str:
         # Strip time parameters & extra queries to stabilize requests
@@ -180,7 +333,7 @@ class PlaylistDownloader:
         """
         if self._is_single_video_url(playlist_url):
             playlist_url = self._normalize_video_url(playlist_url)
-            single_result = self.download_video(playlist_url, audio_only=audio_only, captions=captions, captions_auto=captions_auto, caption_langs=caption_langs)
+            single_result = self.download_video(playlist_url, audio_only=audio_only, captions=captions, captions_auto=captions_auto, caption_langs=caption_langs, force=force)
             return [single_result] if single_result else []
         # New session assembly
         session = PlaylistSession(
@@ -189,7 +342,7 @@ class PlaylistDownloader:
             started=datetime.utcnow(),
             quality_order=self.config.quality_order,
             audio_only=self.config.audio_only if audio_only is None else audio_only,
-            config_snapshot=self.config.__dict__.copy(),
+            config_snapshot=self._snapshot_config(),
         )
         # Expose session for incremental counting in worker callbacks
         self.last_session = session
@@ -200,29 +353,54 @@ class PlaylistDownloader:
         effective_audio = session.audio_only
         log = get_logger()
         try:
-            # Use yt-dlp to extract playlist info
-            ydl_opts: dict[str, Any] = {
-                "quiet": True,
-                "no_warnings": True,
-                "extract_flat": True,
-            }
-
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:  # type: ignore[arg-type]
-                playlist_info = ydl.extract_info(playlist_url, download=False)
-                log.info(f"Extracted playlist info for {playlist_url}: entries={len(playlist_info.get('entries', []))}")
-                if not playlist_info:
-                    log.error(f"No playlist info extracted for {playlist_url}")
-                    return []
-                # If this is actually a single video extraction (no entries), treat it as such
-                if "entries" not in playlist_info:
-                    single_result = self.download_video(
-                        playlist_url, audio_only=audio_only
-                    )
-                    return [single_result] if single_result else []
-
             out_dir = self.config.output_dir
             out_dir.mkdir(parents=True, exist_ok=True)
             manifest = Manifest.load(out_dir)
+            # Resume reuses a recent listing recorded by the previous run instead
+            # of re-fetching the playlist page; older listings are re-fetched so
+            # newly added videos are not missed
+            entries = (
+                manifest.cached_entries(playlist_url) if resume and not force else None
+            )
+            if entries is not None:
+                log.info(f"Reusing cached playlist listing for {playlist_url}: entries={len(entries)}")
+            else:
+                # Use yt-dlp to extract playlist info
+                ydl_opts: dict[str, Any] = {
+                    "quiet": True,
+                    "no_warnings": True,
+                    "extract_flat": True,
+                }
+
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:  # type: ignore[arg-type]
+                    playlist_info = ydl.extract_info(playlist_url, download=False)
+                    if not playlist_info:
+                        log.error(f"No playlist info extracted for {playlist_url}")
+                        return []
+                    log.info(f"Extracted playlist info for {playlist_url}: entries={len(playlist_info.get('entries') or [])}")
+                    # If this is actually a single video extraction (no entries), treat it as such
+                    if "entries" not in playlist_info:
+                        single_result = self.download_video(
+                            playlist_url,
+                            audio_only=audio_only,
+                            captions=bool(captions),
+                            captions_auto=bool(captions_auto),
+                            caption_langs=caption_langs,
+                            force=force,
+                        )
+                        return [single_result] if single_result else []
+
+                entries = [
+                    {
+                        "index": idx,
+                        "id": entry["id"],
+                        "url": entry.get("url"),
+                        "title": entry.get("title"),
+                    }
+                    for idx, entry in enumerate(playlist_info["entries"], start=1)
+                    if entry  # Sometimes entries can be None
+                ]
+                manifest.set_entries(entries)
             manifest.set_playlist(playlist_url)
             skip_ids = set()
             if resume and not force:
@@ -230,10 +408,7 @@ class PlaylistDownloader:
 
             # Build provisional video items
             items: List[VideoItem] = []
-            for idx, entry in enumerate(playlist_info["entries"], start=1):
-                if not entry:  # Sometimes entries can be None
-                    continue
-
+            for entry in entries:
                 video_url = (
                     entry.get("url") or f"https://www.youtube.com/watch?v={entry['id']}"
                 )
@@ -244,9 +419,9 @@ class PlaylistDownloader:
 
                 items.append(
                     VideoItem(
-                        index=idx,
+                        index=entry["index"],
                         video_id=vid_id,
-                        title=entry.get("title", video_url),
+                        title=entry.get("title") or video_url,
                         preferred_quality=self.config.preferred(),
                         audio_only=effective_audio,
                     )
@@ -255,14 +430,14 @@ class PlaylistDownloader:
             items = apply_filters(items, filters, index_range)
             log.info(f"Filtered to {len(items)} videos for download")
 
-            with (
-                self.progress,
-                ThreadPoolExecutor(max_workers=self.config.max_concurrency) as executor,
-            ):
-                futures = []
-                batch_size = max(1, self.config.max_concurrency * 2)
-                for idx, vid in enumerate(items, start=1):
-                    futures.append(
+            executor = self._get_executor()
+            with self.progress:
+                # Sliding window: refill as soon as any video finishes so one
+                # slow download never holds back the rest of a batch
+                window = max(1, self.config.max_concurrency * 2)
+                in_flight: set[Future] = set()
+                for vid in items:
+                    in_flight.add(
                         executor.submit(
                             self._process_video_enriched,
                             vid,
@@ -275,60 +450,74 @@ class PlaylistDownloader:
                             force,
                         )
                     )
-                    if len(futures) >= batch_size:
-                        for f in futures:
-                            res = f.result()
-                            if res:
-                                results.append(res)
-                        futures.clear()
+                    if len(in_flight) >= window:
+                        in_flight = self._collect_results(
+                            in_flight, results, FIRST_COMPLETED
+                        )
                 # drain remaining
-                for f in futures:
-                    res = f.result()
-                    if res:
-                        results.append(res)
+                self._collect_results(in_flight, results)
             session.videos.extend(items)
             session.ended = datetime.utcnow()
             # Backfill counts if incremental path was skipped (should rarely happen)
             if session.counts["total"] == 0:
+                statuses = Counter(map(attrgetter("status"), results))
                 session.counts["total"] = len(results)
-                session.counts["success"] = sum(
-                    1 for r in results if r.status == "success"
-                )
-                session.counts["failed"] = sum(
-                    1 for r in results if r.status == "failed"
-                )
+                session.counts["success"] = statuses["success"]
+                session.counts["failed"] = statuses["failed"]
                 session.counts["skipped"] = 0
                 session.counts["fallbacks"] = sum(
-                    1 for r in results if r.fallback_applied
+                    map(attrgetter("fallback_applied"), results)
                 )
             manifest.save()
             if self.plugin_manager:
                 self.plugin_manager.on_playlist_complete(session)
         except UnavailableVideoError as e:
             log.error(f"Playlist unavailable: {playlist_url}: {e}")
-            from rich import print as rprint
-
-            rprint(f"[bold red]Playlist unavailable: {e}[/bold red]")
+            echo(f"Playlist unavailable: {e}", style="bold red")
         except ExtractorError as e:
             log.error(f"Failed to extract playlist info for {playlist_url}: {e}")
-            from rich import print as rprint
-
-            rprint(f"[bold red]Failed to extract playlist: {e}[/bold red]")
+            echo(f"Failed to extract playlist: {e}", style="bold red")
         except YoutubeDLError as e:
             log.error(f"yt-dlp error processing playlist {playlist_url}: {e}")
-            from rich import print as rprint
-
-            rprint(f"[bold red]yt-dlp error: {e}[/bold red]")
+            echo(f"yt-dlp error: {e}", style="bold red")
         except Exception as e:
             log.error(f"Unexpected error processing playlist {playlist_url}: {e}")
-            from rich import print as rprint
-
-            rprint(f"[bold red]Unexpected playlist error: {e}[/bold red]")
+            echo(f"Unexpected playlist error: {e}", style="bold red")
         return results  # session retained internally (future: return session)
 
+    def _collect_results(
+        self,
+        futures: set[Future],
+        results: List[VideoResult],
+        return_when: str = ALL_COMPLETED,
+    ) -> set[Future]:
+        """Wait on ``futures`` per ``return_when``, gather the finished ones.
+
+        Returns the futures still running. If the wait is interrupted (e.g.
+        Ctrl+C), queued work that has not started yet is cancelled so the
+        shared pool does not keep going.
+        """
+        log = get_logger()
+        try:
+            done, pending = wait(futures, return_when=return_when)
+        except BaseException:
+            for fut in futures:
+                fut.cancel()
+            raise
+        for fut in done:
+            exc = fut.exception()
+            if exc is not None:
+                log.error(f"Worker failed while processing video: {exc}")
+                continue
+            res = fut.result()
+            if res:
+                results.append(res)
+        return pending
+
     def download_video(
         self, video_url: str, audio_only: Optional[bool] = None,
-        captions: bool = False, captions_auto: bool = False, caption_langs: Optional[list[str]] = None
+        captions: bool = False, captions_auto: bool = False, caption_langs: Optional[list[str]] = None,
+        force: bool = False,
     ) -> Optional[VideoResult]:
         """Download a single YouTube video (no playlist context).
 
@@ -344,13 +533,15 @@ class PlaylistDownloader:
             Whether to download auto captions.
         caption_langs: Optional[list[str]]
             List of caption languages to try.
+        force: bool
+            Refetch captions even if caption files already exist on disk.
         """
         log = get_logger()
         video_url = self._normalize_video_url(video_url)
         effective_audio = self.config.audio_only if audio_only is None else audio_only
         vr = self._process_video(video_url, self.config.output_dir, effective_audio)
         if vr and vr.status == "success":
-            video_id = video_url.split('v=')[1].split('&')[0] if 'v=' in video_url else video_url.split('/')[-1].split('?')[0]
+            video_id = video_id_from_url(video_url)
             video = VideoItem(
                 index=1,
                 video_id=video_id,
@@ -359,24 +550,15 @@ class PlaylistDownloader:
                 audio_only=effective_audio,
             )
             if captions or captions_auto:
-                cap_service = CaptionsService(self.config.output_dir, caption_langs or ["en"])
+                cap_service = self._captions_for(self.config.output_dir, caption_langs or ["en"], force)
+                self._prime_captions(cap_service, video_id)
                 tracks = cap_service.obtain(video, captions, captions_auto)
                 log.info(f"Downloaded {len(tracks)} caption tracks for single video {video_id}")
         return vr
 
     # --- URL helpers -------------------------------------------------
     def _is_single_video_url(self, url: str) -> bool:
-        # Heuristics for identifying a single video (not a playlist):
-        # - Standard watch URL without list=
-        # - youtu.be short link (optionally with extra query params)
-        # - Shorts URL
-        if "watch?v=" in url and "list=" not in url:
-            return True
-        if "youtu.be/" in url and "list=" not in url:
-            return True
-        if "/shorts/" in url:
-            return True
-        return False
+        return is_single_video_url(url)
 
     def _process_video_enriched(
         self,
@@ -391,7 +573,10 @@ class PlaylistDownloader:
     ):
         # Reuse existing logic minimally (call original _process_video) but adapt result into VideoItem
         vr = self._process_video(
-            f"https://www.youtube.com/watch?v={video.video_id}", output_path, audio_only
+            f"https://www.youtube.com/watch?v={video.video_id}",
+            output_path,
+            audio_only,
+            video_id=video.video_id,
         )
         if vr and vr.status == "success":
             video.status = "success"
@@ -400,15 +585,12 @@ class PlaylistDownloader:
             video.duration = vr.duration
             video.resolution = vr.resolution
             video.filepath = vr.filepath
-            # Capture size if available from last selected format
-            if getattr(self, "_last_selected_format", None):
-                sf = self._last_selected_format
-                if sf:
-                    video.size_bytes = sf.get("filesize") or sf.get("filesize_approx")
+            video.size_bytes = vr.size_bytes
             # Create filename using naming template from config
             video.filename = expand_template(self.config.naming_template, video)
             if captions or captions_auto:
-                cap_service = CaptionsService(output_path, caption_langs)
+                cap_service = self._captions_for(output_path, caption_langs, _force)
+                self._prime_captions(cap_service, video.video_id)
                 tracks = cap_service.obtain(video, captions, captions_auto)
                 if tracks:
                     video.captions.extend(tracks)
@@ -434,44 +616,62 @@ class PlaylistDownloader:
 
     # Internal helpers
     def _process_video(
-        self, url: str, output_path: Path, audio_only: bool
+        self,
+        url: str,
+        output_path: Path,
+        audio_only: bool,
+        video_id: Optional[str] = None,
     ) -> Optional[VideoResult]:
         """
         Refactored end-to-end download pipeline:
-          1. Extract metadata (once)
+          1. Extract metadata (once, or reuse a fresh on-disk copy by video_id)
           2. Build format selector deterministically
           3. Download using selector
           4. Verify presence (basic: file exists & non-zero; format meta had video when expected)
           5. Captions (handled in enriched path)
         """
         log = get_logger()
+        meta_cache = self._metadata_cache_for(output_path) if video_id else None
+        self._tls.info = None
 
-        for attempt in range(self.config.retry_attempts):
+        attempt = 0
+        while attempt < self.config.retry_attempts:
+            cached = False
             try:
-                extract_opts: dict[str, Any] = {
-                    "quiet": True,
-                    "no_warnings": True,
-                    "skip_unavailable_fragments": True,
-                    "retries": self.config.retry_attempts,
-                    "fragment_retries": self.config.retry_attempts,
-                    "extract_flat": False,
-                }
-                with yt_dlp.YoutubeDL(extract_opts) as ydl:  # type: ignore[arg-type]
+                # Single extraction per video: the same handle resolves metadata
+                # and later downloads from it via process_ie_result
+                ydl = self._ydl_for(output_path, audio_only)
+                info = None
+                if meta_cache:
+                    # Best effort: a cache failure is treated as a miss
+                    try:
+                        info = meta_cache.get(video_id)
+                    except METADATA_CACHE_ERRORS as e:
+                        log.debug(f"Metadata cache read failed for {url}: {e}")
+                cached = info is not None
+                if info is None:
                     info = ydl.extract_info(url, download=False)
-                if not info:
-                    raise DownloadError("No metadata extracted")
+                    if not info:
+                        raise DownloadError("No metadata extracted")
+                    if meta_cache:
+                        try:
+                            meta_cache.put(video_id, ydl.sanitize_info(info))
+                        except METADATA_CACHE_ERRORS as e:
+                            log.debug(f"Metadata cache write failed for {url}: {e}")
+                else:
+                    log.info(f"Using cached metadata for {url}")
 
                 title_raw = info.get("title")
                 title = title_raw if isinstance(title_raw, str) and title_raw else url
                 formats = info.get("formats") or []
                 log.info(f"Found {len(formats)} formats for {url}")
-                log.info(f"All format ids: {[f.get('format_id') for f in formats]}")
-                if formats:
+                if formats and log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"All format ids: {[f.get('format_id') for f in formats]}")
                     format_summary = [
                         f"{f.get('format_id', 'unknown')} h={f.get('height', 'N/A')} vcodec={f.get('vcodec', 'none')} acodec={f.get('acodec', 'none')}"
                         for f in formats[:5]
                     ]
-                    log.info(f"First 5 formats: {format_summary}")
+                    log.debug(f"First 5 formats: {format_summary}")
                 if not formats:
                     return VideoResult(
                         url=url,
@@ -480,99 +680,51 @@ class PlaylistDownloader:
                         failure_reason="No formats",
                     )
 
-                heights = [
-                    f.get("height") for f in formats if isinstance(f.get("height"), int)
-                ]
-                log.info(f"Video heights: {heights}")
-
-                fs = FormatSelector(self.config.quality_order, audio_only)
-                format_string, reasons = fs.build()
-                log.info(
-                    "Format selector chain: %s (reasons=%s)", format_string, reasons
-                )
-
-                outtmpl = f"{output_path}/%(title)s.%(ext)s"
-                download_opts: dict[str, Any] = {
-                    "quiet": True,
-                    "no_warnings": True,
-                    "outtmpl": outtmpl,
-                    "progress_hooks": [self._yt_dlp_progress_hook],
-                    "retries": self.config.retry_attempts,
-                    "fragment_retries": self.config.retry_attempts,
-                    "skip_unavailable_fragments": True,
-                    "format": format_string,
-                }
-                ffmpeg_available = shutil.which('ffmpeg') is not None
-                if audio_only:
-                    if ffmpeg_available:
-                        download_opts.update(
-                            {
-                                "postprocessors": [
-                                    {
-                                        "key": "FFmpegExtractAudio",
-                                        "preferredcodec": "mp3",
-                                        "preferredquality": "192",
-                                    }
-                                ],
-                                "prefer_ffmpeg": True,
-                            }
-                        )
-                    else:
-                        log.warning("FFmpeg not found. Audio extraction may fail.")
-                else:
-                    if ffmpeg_available:
-                        download_opts.update({"merge_output_format": "mp4", "prefer_ffmpeg": True})
-                    else:
-                        log.warning("FFmpeg not found. Video will be downloaded in original format without forced conversion.")
-
-                est_size = 0
-                for f in formats:
-                    if f.get("vcodec") not in (None, "none"):
-                        est_size = f.get("filesize") or f.get("filesize_approx") or 0
-                        break
-                task_id = self.progress.add_task(
-                    description=title[:50], total=est_size, visible=True
-                )
-                self._current_task_id = task_id
-
-                with yt_dlp.YoutubeDL(download_opts) as ydl:  # type: ignore[arg-type]
-                    ydl.download([url])
+                # Total is filled in by the progress hook once yt-dlp reports the
+                # size of the format it actually selected
+                # Audio-only runs have no bar to show, so skip registering one
+                task_id = None
+                if not audio_only:
+                    task_id = self.progress.add_task(
+                        description=title[:50], total=None, visible=True
+                    )
+                progress_key = next(self._progress_tokens)
+                info[PROGRESS_TOKEN_KEY] = progress_key
+                with self._progress_lock:
+                    self._progress_state[progress_key] = [task_id, 0]
+                try:
+                    result = ydl.process_ie_result(info, download=True)
+                finally:
+                    with self._progress_lock:
+                        self._progress_state.pop(progress_key, None)
                 log.info(f"yt-dlp download completed for {url}")
-                sanitized_title = sanitize_filename(title)
-                pattern = f"{output_path}/{sanitized_title}.*"
-                files = glob.glob(pattern)
-                if files:
-                    actual_path = files[0]
-                    log.info(f"Output file: {actual_path}, size: {os.path.getsize(actual_path)} bytes")
+                actual_path = self._output_file(result, output_path, title)
+                size_bytes = None
+                if actual_path:
+                    size_bytes = os.path.getsize(actual_path)
+                    log.info(f"Output file: {actual_path}, size: {size_bytes} bytes")
+                    _drop_page_cache(actual_path)
                 else:
                     log.warning("Output file not found")
 
-                self.progress.update(task_id, visible=False)
+                if task_id is not None:
+                    self.progress.update(task_id, visible=False)
 
                 fallback_applied = False
+                derived_quality = "audio"
                 if not audio_only:
+                    height = self._selected_height(result, formats)
+                    derived_quality = self._height_to_quality(height)
                     pref_h = self._quality_to_height(self.config.preferred())
-                    if pref_h not in heights:
-                        fallback_applied = True
-
-                derived_quality = (
-                    "audio"
-                    if audio_only
-                    else self._format_to_quality(
-                        {
-                            "height": max(
-                                [h for h in heights if isinstance(h, int)], default=0
-                            )
-                        },
-                        audio_only,
-                    )
-                )
+                    fallback_applied = height != pref_h
                 resolution = (
                     f"{info.get('width')}x{info.get('height')}"
                     if info.get("width") and info.get("height")
                     else None
                 )
 
+                # Handed to the caption step via _prime_captions (same thread)
+                self._tls.info = info
                 return VideoResult(
                     url=url,
                     title=title,
@@ -581,7 +733,8 @@ class PlaylistDownloader:
                     fallback_applied=fallback_applied,
                     duration=info.get("duration"),
                     resolution=resolution,
-                    filepath=actual_path if 'actual_path' in locals() else None,
+                    filepath=actual_path,
+                    size_bytes=size_bytes,
                 )
 
             except UnavailableVideoError as e:
@@ -618,7 +771,18 @@ class PlaylistDownloader:
                 )
             except DownloadError as e:
                 log.warning(f"Download failed for {url} on attempt {attempt + 1}: {e}")
-                if attempt < self.config.retry_attempts - 1:
+                if cached:
+                    # Cached format URLs may have expired; retry at once with
+                    # fresh info without spending one of the configured attempts
+                    try:
+                        meta_cache.invalidate(video_id)
+                    except METADATA_CACHE_ERRORS as e:
+                        # Can't drop the stale entry; stop consulting the cache
+                        log.debug(f"Metadata cache invalidate failed for {url}: {e}")
+                        meta_cache = None
+                    continue
+                attempt += 1
+                if attempt < self.config.retry_attempts:
                     time.sleep(self.config.timeout_seconds)
                 else:
                     return VideoResult(
@@ -645,62 +809,229 @@ class PlaylistDownloader:
             url=url, title=url, status="failed", failure_reason="Max retries reached"
         )
 
-    def _quality_to_height(self, quality: str) -> int:
-        """Convert quality string to height in pixels."""
-        quality_map = {
-            "144p": 144,
-            "240p": 240,
-            "360p": 360,
-            "480p": 480,
-            "720p": 720,
-            "1080p": 1080,
-            "1440p": 1440,
-            "2160p": 2160,
+    def _download_opts(self, output_path: Path, audio_only: bool) -> dict[str, Any]:
+        fs = FormatSelector(self.config.quality_order, audio_only)
+        format_string, reasons = fs.build()
+        log = get_logger()
+        log.info("Format selector chain: %s (reasons=%s)", format_string, reasons)
+        opts: dict[str, Any] = {
+            "quiet": True,
+            "no_warnings": True,
+            "outtmpl": f"{output_path}/%(title)s.%(ext)s",
+            "progress_hooks": [self._yt_dlp_progress_hook],
+            "retries": self.config.retry_attempts,
+            "fragment_retries": self.config.retry_attempts,
+            # Fail (and retry) stalled reads instead of hanging on a dead connection
+            "socket_timeout": self.config.timeout_seconds,
+            "skip_unavailable_fragments": True,
+            "extract_flat": False,
+            "buffersize": DOWNLOAD_BUFFER_SIZE,
+            "noresizebuffer": True,
+            "concurrent_fragment_downloads": max(1, self.config.fragment_concurrency),
+            "format": format_string,
         }
-        return quality_map.get(quality, 720)
-
-    def _format_to_quality(self, format_item: Dict, audio_only: bool) -> str:
-        """Convert format info back to quality string."""
+        segments = self.config.segments_per_video
+        if segments > 1:
+            # Progressive (non-fragmented) formats come down one connection at a
+            # time; aria2c splits each file into parallel byte-range segments
+            if shutil.which("aria2c"):
+                opts["external_downloader"] = {"http": "aria2c"}
+                opts["external_downloader_args"] = {
+                    "aria2c": [
+                        f"--max-connection-per-server={min(segments, 16)}",
+                        f"--split={segments}",
+                        "--min-split-size=1M",
+                    ]
+                }
+            else:
+                log.warning("aria2c not found. Segmented downloads disabled.")
+        ffmpeg_available = shutil.which("ffmpeg") is not None
         if audio_only:
-            return "audio"
-
-        height = format_item.get("height", 0)
-        if height >= 2160:
-            return "2160p"
-        elif height >= 1440:
-            return "1440p"
-        elif height >= 1080:
-            return "1080p"
-        elif height >= 720:
-            return "720p"
-        elif height >= 480:
-            return "480p"
-        elif height >= 360:
-            return "360p"
-        elif height >= 240:
-            return "240p"
+            if ffmpeg_available:
+                opts.update(
+                    {
+                        "postprocessors": [
+                            {
+                                "key": "FFmpegExtractAudio",
+                                "preferredcodec": "mp3",
+                                "preferredquality": "192",
+                            }
+                        ],
+                        "prefer_ffmpeg": True,
+                    }
+                )
+            else:
+                log.warning("FFmpeg not found. Audio extraction may fail.")
         else:
-            return "144p"
+            if ffmpeg_available:
+                opts.update({"merge_output_format": "mp4", "prefer_ffmpeg": True})
+            else:
+                log.warning("FFmpeg not found. Video will be downloaded in original format without forced conversion.")
+        return opts
+
+    def _output_file(
+        self, result: Optional[dict], output_path: Path, title: str
+    ) -> Optional[str]:
+        """Locate the file yt-dlp wrote for a video.
+
+        Prefer the final path yt-dlp reports (after merging/post-processing);
+        otherwise scan the output directory by title prefix. A glob pattern
+        would misfire on titles containing ``[`` or ``]``.
+        """
+        for entry in reversed((result or {}).get("requested_downloads") or []):
+            path = entry.get("filepath")
+            if path and os.path.exists(path):
+                return path
+        prefix = sanitize_filename(title) + "."
+        try:
+            with os.scandir(output_path) as it:
+                for entry in it:
+                    if entry.name.startswith(prefix) and entry.is_file():
+                        return entry.path
+        except OSError:
+            pass
+        return None
+
+    def _ydl_for(self, output_path: Path, audio_only: bool) -> yt_dlp.YoutubeDL:
+        """Return the calling thread's YoutubeDL for this output target.
+
+        Reusing one handle per worker keeps extractor state (player JS,
+        signature functions) and pooled HTTP connections warm across videos.
+        """
+        cache = getattr(self._tls, "ydls", None)
+        if cache is None:
+            cache = self._tls.ydls = {}
+            with self._ydl_lock:
+                self._ydl_caches.append(cache)
+        key = (str(output_path), audio_only)
+        ydl = cache.get(key)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self._download_opts(output_path, audio_only))  # type: ignore[arg-type]
+            cache[key] = ydl
+        return ydl
+
+    def _captions_for(
+        self, output_path: Path, languages: list[str], force: bool = False
+    ) -> CaptionsService:
+        """Return the shared CaptionsService for this output target.
+
+        ``force`` makes the service refetch captions even when a caption file
+        from an earlier run is already on disk.
+        """
+        key = (str(output_path), tuple(languages), force)
+        with self._ydl_lock:
+            service = self._caption_services.get(key)
+            if service is None:
+                service = self._caption_services[key] = CaptionsService(
+                    output_path, list(languages), force_refresh=force
+                )
+        return service
+
+    def _prime_captions(self, service: CaptionsService, video_id: str) -> None:
+        """Pass the info dict this thread just downloaded from to ``service``."""
+        info = getattr(self._tls, "info", None)
+        self._tls.info = None
+        if info and info.get("id") == video_id:
+            service.prime_info(video_id, info)
+
+    def _metadata_cache_for(self, output_path: Path) -> Optional[MetadataCache]:
+        """Return the on-disk info cache for this output target, if enabled."""
+        if self.config.metadata_cache_ttl <= 0:
+            return None
+        key = str(output_path)
+        with self._ydl_lock:
+            if key not in self._metadata_caches:
+                try:
+                    output_path.mkdir(parents=True, exist_ok=True)
+                    cache = MetadataCache.open(output_path, self.config.metadata_cache_ttl)
+                except Exception as e:
+                    get_logger().debug(f"Metadata cache unavailable in {output_path}: {e}")
+                    cache = None
+                self._metadata_caches[key] = cache
+            return self._metadata_caches[key]
+
+    def _close_ydls(self) -> None:
+        """Close every cached YoutubeDL handle (threads recreate on demand)."""
+        with self._ydl_lock:
+            caches = list(self._ydl_caches)
+        for cache in caches:
+            for ydl in list(cache.values()):
+                try:
+                    ydl.close()
+                except Exception:
+                    pass
+            cache.clear()
+
+    @staticmethod
+    def _selected_height(result: Optional[dict], formats: List[dict]) -> int:
+        """Height of the video format yt-dlp actually downloaded.
+
+        Falls back to the tallest real video format (storyboards carry a
+        height but no video codec) when the result does not report one.
+        """
+        for entry in reversed((result or {}).get("requested_downloads") or []):
+            height = entry.get("height")
+            if isinstance(height, int):
+                return height
+        return max(
+            (
+                f["height"]
+                for f in formats
+                if isinstance(f.get("height"), int)
+                and f.get("vcodec") not in NO_VIDEO_CODECS
+            ),
+            default=0,
+        )
+
+    def _quality_to_height(self, quality: str) -> int:
+        """Convert quality string to height in pixels."""
+        return QUALITY_HEIGHTS.get(quality, 720)
+
+    @staticmethod
+    def _height_to_quality(height: int) -> str:
+        """Map a pixel height to the nearest quality label at or below it."""
+        for threshold, label in QUALITY_THRESHOLDS:
+            if height >= threshold:
+                return label
+        return "144p"
 
     def _yt_dlp_progress_hook(self, d):
-        """Progress hook for yt-dlp downloads."""
-        if hasattr(self, "_current_task_id") and self._current_task_id is not None:
+        """Progress hook for yt-dlp downloads.
+
+        May run on yt-dlp's fragment threads, so state is looked up by the
+        progress token yt-dlp passes along in the info dict rather than by
+        calling thread.
+        """
+        key = (d.get("info_dict") or {}).get(PROGRESS_TOKEN_KEY)
+        with self._progress_lock:
+            state = self._progress_state.get(key)
+            task_id = state[0] if state else None
             if d["status"] == "downloading":
                 downloaded = d.get("downloaded_bytes", 0)
-                total = d.get("total_bytes") or d.get("total_bytes_estimate", 0)
-                if total > 0:
+                if state is not None:
+                    # Coalesce per-block hook calls; a smaller value means
+                    # yt-dlp moved on to the next format (e.g. audio after video)
+                    delta = downloaded - state[1]
+                    if 0 <= delta < PROGRESS_FLUSH_BYTES:
+                        return
+                    state[1] = downloaded
+        if d["status"] == "downloading":
+            total = d.get("total_bytes") or d.get("total_bytes_estimate", 0)
+            if total > 0:
+                if task_id is not None:
                     self.progress.update(
-                        self._current_task_id, completed=downloaded, total=total
+                        task_id, completed=downloaded, total=total
                     )
-                    if self.progress_callback:
-                        progress = (downloaded / total) * 100
-                        self.progress_callback(progress)
-            elif d["status"] == "finished":
+                if self.progress_callback:
+                    progress = (downloaded / total) * 100
+                    self.progress_callback(progress)
+        elif d["status"] == "finished":
+            if task_id is not None:
                 self.progress.update(
-                    self._current_task_id, completed=d.get("total_bytes", 0)
+                    task_id, completed=d.get("total_bytes", 0)
                 )
-                if self.progress_callback:
-                    self.progress_callback(100)
+            if self.progress_callback:
+                self.progress_callback(100)
 
     def _progress_callback(
         self, stream, chunk, bytes_remaining
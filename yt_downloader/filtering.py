@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Iterable, List, Tuple
 from .models import VideoItem
 
@@ -8,12 +9,18 @@ class IndexRangeError(ValueError):
     pass
 
 
+_INDEX_RANGE_RE = re.compile(r"(\d*):(\d*)\Z")
+
+
 def parse_index_range(spec: str | None) -> Tuple[int | None, int | None]:
     if not spec:
         return None, None
-    if ":" not in spec:
-        raise IndexRangeError("Index range must contain colon")
-    start_s, end_s = spec.split(":", 1)
+    m = _INDEX_RANGE_RE.match(spec)
+    if m is None:
+        if ":" not in spec:
+            raise IndexRangeError("Index range must contain colon")
+        raise IndexRangeError("Index range bounds must be non-negative integers")
+    start_s, end_s = m.groups()
     start = int(start_s) if start_s else None
     end = int(end_s) if end_s else None
     if start is not None and end is not None and end < start:
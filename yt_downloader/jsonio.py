@@ -0,0 +1,60 @@
+"""JSON encode/decode helpers.
+
+Uses orjson when it is installed (``pip install yt-downloader[fast]``) and
+falls back to the stdlib ``json`` module otherwise. Both paths produce UTF-8
+bytes with two-space indentation so callers can write them straight to disk.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+try:  # optional accelerated encoder
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def dumps(
+    obj: Any, indent: bool = True, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a sibling temp file and ``os.replace``.
+
+    Readers never observe a half-written file, and an interrupted run leaves
+    the previous version intact.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    except BaseException:
+        os.close(fd)
+        tmp.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+    os.replace(tmp, path)
+
+
+__all__ = ["dumps", "loads", "write_atomic"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import logging
+import sys
 from typing import Optional
 
 _LOGGER: Optional[logging.Logger] = None
@@ -18,3 +19,19 @@ def get_logger() -> logging.Logger:
         logger.setLevel(logging.INFO)
         _LOGGER = logger
     return _LOGGER
+
+
+def echo(message: str, style: Optional[str] = None) -> None:
+    """Print a console message, styled only when stdout is a terminal.
+
+    ``message`` is printed literally (never parsed as Rich markup), so text
+    like yt-dlp's ``[youtube]`` prefixes survives. Redirected output (log
+    files, CI, tests) skips Rich altogether and gets plain text.
+    """
+    stream = sys.stdout
+    if stream is not None and stream.isatty():
+        from rich import get_console
+
+        get_console().print(message, style=style, markup=False, highlight=False)
+    else:
+        print(message, file=stream)
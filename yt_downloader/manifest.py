@@ -1,51 +1,86 @@
 from __future__ import annotations
 
-import json
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Iterable, Any, TypedDict, Optional
+from typing import Dict, Iterable, Any, List, TypedDict, Optional
 from .models import ManifestEntry, VideoItem
+from .jsonio import dumps, loads, write_atomic
 
 MANIFEST_FILENAME = "manifest.json"
+# How long a recorded playlist listing is trusted before resume re-lists, so
+# videos added to the playlist after the first run are still picked up
+LISTING_TTL = 3600.0
 
 
 class _ManifestData(TypedDict, total=False):
     playlist_url: Optional[str]
     videos: Dict[str, Dict[str, Any]]
+    entries: List[Dict[str, Any]]
+    entries_fetched: float
 
 
 class Manifest:
     def __init__(self, path: Path):
         self.path = path
         self.data: _ManifestData = {"playlist_url": None, "videos": {}}
+        # Set by every change that differs from what is on disk
+        self._dirty = False
 
     @classmethod
     def load(cls, directory: Path) -> "Manifest":
         m = cls(directory / MANIFEST_FILENAME)
         if m.path.exists():
             try:
-                m.data = json.loads(m.path.read_text())
+                m.data = loads(m.path.read_bytes())
             except Exception:
                 # Corrupted manifest: start fresh
                 m.data = {"playlist_url": None, "videos": {}}  # reset on corruption
         return m
 
     def set_playlist(self, url: str):
-        self.data["playlist_url"] = url
+        if self.data.get("playlist_url") != url:
+            self.data["playlist_url"] = url
+            self._dirty = True
+
+    def set_entries(self, entries: List[Dict[str, Any]]):
+        """Record the flat playlist listing (index/id/url/title per entry)."""
+        self.data["entries"] = entries
+        self.data["entries_fetched"] = time.time()
+        self._dirty = True
+
+    def cached_entries(
+        self, url: str, max_age: float = LISTING_TTL
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return the recorded listing if it belongs to ``url`` and is fresh."""
+        if self.data.get("playlist_url") != url:
+            return None
+        fetched = self.data.get("entries_fetched")
+        if fetched is None or time.time() - fetched > max_age:
+            return None
+        return self.data.get("entries")
 
     def update_video(self, video: VideoItem):
         if "videos" not in self.data or self.data["videos"] is None:  # type: ignore[truthy-bool]
             self.data["videos"] = {}
-        self.data["videos"][video.video_id] = {  # type: ignore[index]
+        record = {
             "status": video.status,
             "quality": video.selected_quality,
             "fallback": video.fallback_applied,
             "retries": video.retries,
             "filename": video.filename,
         }
+        videos = self.data["videos"]  # type: ignore[index]
+        if videos.get(video.video_id) != record:
+            videos[video.video_id] = record
+            self._dirty = True
 
     def save(self):
-        self.path.write_text(json.dumps(self.data, indent=2))
+        """Write the manifest, skipping the write when nothing changed."""
+        if not self._dirty:
+            return
+        write_atomic(self.path, dumps(self.data))
+        self._dirty = False
 
     def compute_skips(self, directory: Path) -> set[str]:
         skips = set()
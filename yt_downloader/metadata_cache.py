@@ -0,0 +1,83 @@
+"""On-disk cache of extracted video metadata.
+
+Re-running or resuming a playlist would otherwise pay a full yt-dlp
+extraction (watch page, player JS, format manifests) for every video again.
+Sanitized info dicts are stored per video id in a small SQLite database next
+to the downloads and reused while fresh. Format URLs embedded in the info
+expire after a few hours, so entries are kept for far less than that and
+callers drop an entry as soon as a download from it fails.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .jsonio import dumps, loads
+
+CACHE_FILENAME = ".yt_meta.sqlite"
+DEFAULT_TTL = 3600.0
+
+
+class MetadataCache:
+    def __init__(self, path: Path, ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        # Worker threads share one connection; sqlite3 serializes through the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS info ("
+                "video_id TEXT PRIMARY KEY, fetched_at REAL NOT NULL, payload BLOB NOT NULL)"
+            )
+            # Entries from earlier runs that can no longer be served
+            self._conn.execute(
+                "DELETE FROM info WHERE fetched_at < ?", (time.time() - ttl,)
+            )
+            self._conn.commit()
+
+    @classmethod
+    def open(cls, directory: Path, ttl: float = DEFAULT_TTL) -> "MetadataCache":
+        return cls(directory / CACHE_FILENAME, ttl)
+
+    def get(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached info for ``video_id`` if it is still fresh."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, payload FROM info WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        try:
+            return loads(row[1])
+        except Exception:
+            self.invalidate(video_id)
+            return None
+
+    def put(self, video_id: str, info: Dict[str, Any]) -> None:
+        """Store a JSON-safe (sanitized) info dict for ``video_id``."""
+        payload = dumps(info, indent=False, default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO info (video_id, fetched_at, payload) VALUES (?, ?, ?)",
+                (video_id, time.time(), payload),
+            )
+            self._conn.commit()
+
+    def invalidate(self, video_id: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM info WHERE video_id = ?", (video_id,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+__all__ = ["MetadataCache", "CACHE_FILENAME", "DEFAULT_TTL"]
@@ -7,7 +7,7 @@ from typing import List, Optional, Dict, Any
 # Core data models aligned with data-model.md
 
 
-@dataclass
+@dataclass(slots=True)
 class CaptionTrack:
     video_id: str
     language: str
@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+from .jsonio import dumps, write_atomic
 from .models import PlaylistSession, VideoItem
 
 REPORT_FILENAME = "report.json"
@@ -26,12 +27,20 @@ class Report:
     fallbacks: List[Dict[str, Any]]
     videos: List[Dict[str, Any]]
 
+    def to_bytes(self, indent: int | None = 2) -> bytes:
+        # Fields already hold plain containers, so skip asdict()'s deep copy
+        data = vars(self)
+        if indent is None or indent == 2:
+            return dumps(data, indent=indent is not None, default=str)
+        # jsonio (orjson) only does 2-space indentation; honor other widths
+        return json.dumps(data, indent=indent, default=str, ensure_ascii=False).encode("utf-8")
+
     def to_json(self, indent: int | None = 2) -> str:
-        return json.dumps(asdict(self), indent=indent, default=str)
+        return self.to_bytes(indent).decode("utf-8")
 
     def save(self, output_dir: Path) -> Path:
         path = output_dir / REPORT_FILENAME
-        path.write_text(self.to_json())
+        write_atomic(path, self.to_bytes())
         return path
 
 
@@ -53,16 +62,18 @@ def _video_summary(v: VideoItem) -> Dict[str, Any]:
 
 def build_session_report(session: PlaylistSession) -> Report:
     ended = session.ended or datetime.utcnow()
-    failures = [
-        {"videoId": v.video_id, "reason": v.failure_reason or "unknown"}
-        for v in session.videos
-        if v.status == "failed"
-    ]
-    fallbacks = [
-        {"videoId": v.video_id, "from": v.preferred_quality, "to": v.selected_quality}
-        for v in session.videos
-        if v.fallback_applied
-    ]
+    # Single pass over the videos for failures, fallbacks and summaries
+    failures: List[Dict[str, Any]] = []
+    fallbacks: List[Dict[str, Any]] = []
+    videos: List[Dict[str, Any]] = []
+    for v in session.videos:
+        if v.status == "failed":
+            failures.append({"videoId": v.video_id, "reason": v.failure_reason or "unknown"})
+        if v.fallback_applied:
+            fallbacks.append(
+                {"videoId": v.video_id, "from": v.preferred_quality, "to": v.selected_quality}
+            )
+        videos.append(_video_summary(v))
     return Report(
         schema_version=SCHEMA_VERSION,
         playlist_url=session.playlist_url,
@@ -74,7 +85,7 @@ def build_session_report(session: PlaylistSession) -> Report:
         counts=session.counts,
         failures=failures,
         fallbacks=fallbacks,
-        videos=[_video_summary(v) for v in session.videos],
+        videos=videos,
     )
 
 
@@ -1,9 +1,9 @@
 # tui.py
 
-import json
 import os
 import subprocess
 import threading
+from datetime import datetime, timezone
 from logging import Handler, LogRecord
 from pathlib import Path
 from typing import cast
@@ -23,8 +23,8 @@ from textual.widgets import (
     TabPane,
 )
 
-from .config import AppConfig
-from .downloader import PlaylistDownloader
+from .config import DEFAULT_MAX_CONCURRENCY, AppConfig
+from .jsonio import dumps
 from .logging_utils import get_logger
 
 
@@ -90,9 +90,7 @@ class TUIController:
 
         quality = self._app.query_one("#quality", Input).value
         if quality:
-            config.quality_order = [quality] + [
-                q for q in config.quality_order if q != quality
-            ]
+            config.quality_order = AppConfig.quality_order_for(quality)
 
         jobs = self._app.query_one("#jobs", Input).value
         if jobs:
@@ -114,10 +112,7 @@ class TUIController:
 
         # Caption languages
         caption_langs = self._app.query_one("#caption_langs", Input).value
-        if caption_langs:
-            langs = caption_langs.split(",")
-        else:
-            langs = ["en"]
+        langs = [lang.strip() for lang in caption_langs.split(",") if lang.strip()] or ["en"]
 
         # Other options
         filters = self._app.query_one("#filters", Input).value
@@ -143,9 +138,7 @@ class TUIController:
             config.caption_langs = langs
             config.captions_enabled = captions
             config.captions_auto_enabled = captions_auto
-            # Pull current layout ratio from app state if present
-            if hasattr(self._app, "_layout_ratio"):
-                config.layout_ratio = getattr(self._app, "_layout_ratio")
+            config.layout_ratio = self._app._layout_ratio
             cfg_path = Path.home() / ".config" / "yt_pilot" / "config.json"
             config.save(cfg_path)
             self._log.debug(f"Persisted config to {cfg_path}")
@@ -163,6 +156,8 @@ class TUIController:
                 total=100, progress=0
             )
 
+            # One timestamp per run, shared by everything this run emits
+            run_started = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
             try:
                 config, options = self.build_config_from_form()
                 self._log.info(f"Built config: {config.__dict__}")
@@ -172,7 +167,7 @@ class TUIController:
                     # For dry run, create a simple plan JSON
                     plan = {
                         "schemaVersion": "1.0.0",
-                        "generated": "2024-01-01T00:00:00Z",  # placeholder
+                        "generated": run_started,
                         "mode": "dry-run",
                         "playlistUrl": urls[0] if urls else None,
                         "videos": [],  # Would need to extract info
@@ -188,47 +183,68 @@ class TUIController:
                         },
                         "namingTemplate": config.naming_template,
                     }
-                    json_output = json.dumps(plan, indent=2)
+                    json_output = dumps(plan).decode("utf-8")
                     self._app.call_from_thread(self._app.show_dry_run_results, json_output)
                 else:
+                    # Deferred: pulls in yt-dlp and rich, which dry runs never need
+                    from .downloader import PlaylistDownloader, is_single_video_url
+
                     def progress_callback(progress):
                         self._app.call_from_thread(cast(ProgressBar, self._app.query_one("#progress_bar")).update, progress=progress)
                     downloader = PlaylistDownloader(config, progress_callback=progress_callback)
                     self._log.info("Created PlaylistDownloader")
-                    all_results = []
-                    self._log.info(f"Processing {len(urls)} URLs")
-
-                    for url in urls:
-                        self._log.info(f"Starting download for URL: {url}")
-                        if "list=" in url:
-                            results = downloader.download_playlist(
-                                url,
-                                audio_only=config.audio_only,
-                                resume=options.get("resume", False),
-                                filters=options.get("filters"),
-                                index_range=options.get("index_range"),
-                                captions=options.get("captions", False),
-                                captions_auto=options.get("captions_auto", False),
-                                caption_langs=options.get("caption_langs", ["en"]),
-                                force=options.get("force", False),
-                            )
-                        else:
-                            result = downloader.download_video(
-                                url, audio_only=config.audio_only,
-                                captions=options.get("captions", False),
-                                captions_auto=options.get("captions_auto", False),
-                                caption_langs=options.get("caption_langs", ["en"])
-                            )
-                            results = [result] if result else []
-
-                        self._log.info(f"Results for {url}: {len(results)} items")
-                        all_results.extend(results)
+                    total_videos = 0
+                    successes = 0
+                    failures: list[tuple[str, str, str]] = []
+                    # Per-run options, resolved once rather than per target
+                    resume = options.get("resume", False)
+                    filters = options.get("filters")
+                    index_range = options.get("index_range")
+                    captions = options.get("captions", False)
+                    captions_auto = options.get("captions_auto", False)
+                    caption_langs = options.get("caption_langs", ["en"])
+                    force = options.get("force", False)
+                    try:
+                        self._log.info(f"Processing {len(urls)} URLs")
+
+                        for url in urls:
+                            self._log.info(f"Starting download for URL: {url}")
+                            if not is_single_video_url(url):
+                                results = downloader.download_playlist(
+                                    url,
+                                    audio_only=config.audio_only,
+                                    resume=resume,
+                                    filters=filters,
+                                    index_range=index_range,
+                                    captions=captions,
+                                    captions_auto=captions_auto,
+                                    caption_langs=caption_langs,
+                                    force=force,
+                                )
+                            else:
+                                result = downloader.download_video(
+                                    url, audio_only=config.audio_only,
+                                    captions=captions,
+                                    captions_auto=captions_auto,
+                                    caption_langs=caption_langs,
+                                    force=force,
+                                )
+                                results = [result] if result else []
+
+                            self._log.info(f"Results for {url}: {len(results)} items")
+                            total_videos += len(results)
+                            for r in results:
+                                if r.status == "success":
+                                    successes += 1
+                                elif r.status == "failed":
+                                    failures.append((url, r.title, r.failure_reason or "unknown"))
+                    finally:
+                        downloader.close()
 
                     # Report results
-                    self._log.info(f"Total all_results: {len(all_results)}")
-                    total_videos = len(all_results)
-                    successes = sum(1 for r in all_results if r and r.status == "success")
                     self._log.info(f"Completed: {successes}/{total_videos} videos")
+                    for url, title, reason in failures:
+                        self._log.warning(f"Failed: {title} ({url}): {reason}")
 
                 self._log.info("[bold green]All tasks completed![/bold green]")
             except Exception as e:
@@ -327,7 +343,7 @@ class DownloaderApp(App):
                             yield Input(value="60", id="layout_ratio", placeholder="60", classes="small_input")
                             yield Button("Apply Layout", id="apply_layout")
                         yield Static("Max Parallel Downloads (Jobs):", classes="label")
-                        yield Input(value="4", id="jobs", type="integer")
+                        yield Input(value=str(DEFAULT_MAX_CONCURRENCY), id="jobs", type="integer")
                         yield Static(
                             "Video Title Filter (case-insensitive):", classes="label"
                         )
@@ -402,17 +418,9 @@ class DownloaderApp(App):
             control.disabled = is_disabled
 
     def show_dry_run_results(self, json_output: str) -> None:
-        """Displays the dry run JSON output in the appropriate tab."""
-        try:
-            # Pretty-print the JSON
-            parsed_json = json.loads(json_output)
-            pretty_json = json.dumps(parsed_json, indent=2)
-            self.query_one("#dry_run_output", Static).update(pretty_json)
-            self.query_one(TabbedContent).active = "dry_run_tab"
-        except json.JSONDecodeError:
-            self.query_one("#dry_run_output", Static).update(
-                "[bold red]Failed to parse dry-run JSON output.[/bold red]"
-            )
+        """Displays the dry run JSON output (already pretty-printed) in the appropriate tab."""
+        self.query_one("#dry_run_output", Static).update(json_output)
+        self.query_one(TabbedContent).active = "dry_run_tab"
 
     def action_start_download(self) -> None:
         """Start the download when Enter is pressed."""